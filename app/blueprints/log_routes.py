@@ -6,11 +6,67 @@
 # Licensed under the MIT License                                               #
 # ============================================================================ #
 import os
-from flask import Blueprint, Response, current_app, request, jsonify
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from itertools import chain
+from flask import (
+    Blueprint, Response, copy_current_request_context, current_app, request, jsonify,
+    stream_with_context
+)
 from app.auth import auth
+from utils.import_utils import import_orjson
+
+orjson, _HAS_ORJSON = import_orjson()
+
+try:
+    import docker
+except ImportError:
+    docker = None
+
+try:
+    from services.web.container_log_service import (
+        get_container_log_service, ContainerLogRequest, FilteredLogRequest,
+        ActionLogRequest, ClearLogRequest, LogType
+    )
+    _HAS_LOG_SVC = True
+except ImportError:
+    _HAS_LOG_SVC = False
 
 log_bp = Blueprint('log_bp', __name__)
 
+# Candidate log files for the simple fallback reader, in order of preference
+_LOG_PATHS = (
+    '/app/logs/supervisord.log',
+    '/var/log/supervisor/supervisord.log',
+    '/app/logs/bot.log',
+    '/app/logs/discord.log',
+)
+# Remember which candidate exists for a few seconds so polling dashboards
+# don't re-stat every path on each request
+_LOG_PATH_TTL = 5.0
+_LOG_PATH_CACHE = {'path': None, 'expires': 0.0}
+# Fallback tails served to the bot/discord/webui/application panels are
+# shared for this many seconds
+_LOG_TAIL_TTL = 5.0
+
+# Shared Docker client for the simple fallback path (reuses the socket session)
+_DOCKER_CLIENT = None
+_DOCKER_CLIENT_LOCK = threading.Lock()
+
+# Runs the Docker fallback off the request thread so a slow daemon can be
+# abandoned at the deadline. Created lazily so it picks up gevent's patched
+# threading primitives when the app runs under gevent.
+_FALLBACK_POOL = None
+_FALLBACK_POOL_LOCK = threading.Lock()
+# Overall wait for the Docker fallback before the log files are read instead
+_FALLBACK_TIMEOUT = 5.0
+# Socket timeout of the fallback Docker client, so abandoned fetches free
+# their worker soon after the deadline instead of after docker-py's 60s default
+_FALLBACK_DOCKER_TIMEOUT = 3
+
 
 @log_bp.route('/test')
 @auth.login_required
@@ -19,36 +75,214 @@ def test_logs_route():
     return Response("Log routes are working! Test successful.", mimetype='text/plain')
 
 
+def _tail_bytes(path, max_lines, block=65536):
+    """Return the last ``max_lines`` lines of ``path`` without reading the whole file.
+
+    Reads fixed-size blocks backwards from the end of the file until enough
+    newlines have been seen, so the cost is bounded by the tail size rather
+    than the file size.
+    """
+    chunks = deque()
+    newlines = 0
+    with open(path, 'rb') as f:
+        offset = f.seek(0, os.SEEK_END)
+        # One extra newline is needed so a partial first line can be discarded
+        while offset > 0 and newlines <= max_lines:
+            size = min(block, offset)
+            offset -= size
+            f.seek(offset)
+            chunk = f.read(size)
+            chunks.appendleft(chunk)
+            newlines += chunk.count(b'\n')
+
+    data = b''.join(chunks)
+    trailing_newline = data.endswith(b'\n')
+    lines = data.split(b'\n')
+    if trailing_newline:
+        lines.pop()
+    tail = b'\n'.join(lines[-max_lines:])
+    if trailing_newline and tail:
+        tail += b'\n'
+    return tail.decode('utf-8', 'replace')
+
+
+def _resolve_log_path(refresh=False):
+    """Return the first existing fallback log path, cached for ``_LOG_PATH_TTL`` seconds."""
+    now = time.monotonic()
+    if not refresh and now < _LOG_PATH_CACHE['expires']:
+        return _LOG_PATH_CACHE['path']
+    path = next((p for p in _LOG_PATHS if os.path.exists(p)), None)
+    _LOG_PATH_CACHE['path'] = path
+    _LOG_PATH_CACHE['expires'] = now + _LOG_PATH_TTL
+    return path
+
+
+def _json_response(data):
+    """Serialize large JSON payloads with orjson when available, else via jsonify."""
+    if _HAS_ORJSON:
+        try:
+            return Response(orjson.dumps(data), mimetype='application/json')
+        except orjson.JSONEncodeError:
+            # orjson is stricter (e.g. non-str keys) - let Flask's encoder handle it
+            pass
+    return jsonify(data)
+
+
+def _require_log_service():
+    """Raise ImportError when the ContainerLogService module failed to import."""
+    if not _HAS_LOG_SVC:
+        raise ImportError("services.web.container_log_service is unavailable")
+
+
 def _simple_read_logs(max_lines=500):
     """Simple fallback log reader - tries multiple log files."""
-    log_paths = [
-        '/app/logs/supervisord.log',
-        '/var/log/supervisor/supervisord.log',
-        '/app/logs/bot.log',
-        '/app/logs/discord.log',
-    ]
-    for path in log_paths:
+    # Second pass re-probes the paths in case the cached file disappeared
+    for refresh in (False, True):
+        path = _resolve_log_path(refresh=refresh)
+        if path is None:
+            return None
         try:
-            if os.path.exists(path):
-                with open(path, 'r', encoding='utf-8', errors='replace') as f:
-                    lines = f.readlines()
-                    return ''.join(lines[-max_lines:])
-        except Exception:
+            return _tail_bytes(path, max_lines)
+        except FileNotFoundError:
             continue
+        except Exception:
+            return None
     return None
 
 
+@lru_cache(maxsize=1)
+def _simple_read_logs_bucketed(max_lines, bucket):
+    """Memoized ``_simple_read_logs``; ``bucket`` changes every ``_LOG_TAIL_TTL`` seconds."""
+    return _simple_read_logs(max_lines)
+
+
+def _simple_read_logs_cached(max_lines=500):
+    """Like ``_simple_read_logs`` but shares one read between panels polling together."""
+    return _simple_read_logs_bucketed(max_lines, int(time.monotonic() // _LOG_TAIL_TTL))
+
+
+def _get_docker_client():
+    """Return the shared Docker client, creating it on first use."""
+    global _DOCKER_CLIENT
+    client = _DOCKER_CLIENT
+    if client is None:
+        with _DOCKER_CLIENT_LOCK:
+            if _DOCKER_CLIENT is None:
+                _DOCKER_CLIENT = docker.from_env(timeout=_FALLBACK_DOCKER_TIMEOUT)
+            client = _DOCKER_CLIENT
+    return client
+
+
+def _reset_docker_client():
+    """Drop the shared Docker client so the next call rebuilds it."""
+    global _DOCKER_CLIENT
+    with _DOCKER_CLIENT_LOCK:
+        _DOCKER_CLIENT = None
+
+
 def _simple_docker_logs(container_name, max_lines=500):
-    """Simple Docker log reader without async complexity."""
+    """Simple Docker log reader without async complexity.
+
+    Returns a _DockerLogStream over the raw log bytes so the response can be
+    streamed as Docker delivers it, or None if no logs could be fetched.
+    """
+    if docker is None:
+        current_app.logger.warning("Simple Docker logs failed: docker package not installed")
+        return None
     try:
-        import docker
-        client = docker.from_env()
+        client = _get_docker_client()
         container = client.containers.get(container_name)
-        logs = container.logs(tail=max_lines, stdout=True, stderr=True)
-        return logs.decode('utf-8', errors='replace')
+        logs_iter = container.logs(
+            tail=max_lines, stdout=True, stderr=True, stream=True, follow=False
+        )
+        # Pull the first chunk eagerly so empty logs still fall through to the file reader
+        first_chunk = next(logs_iter, None)
+        if first_chunk is None:
+            return None
+    except docker.errors.NotFound as e:
+        current_app.logger.warning("Simple Docker logs failed: %s", e)
+        return None
     except Exception as e:
-        current_app.logger.warning(f"Simple Docker logs failed: {e}")
+        # Daemon/API failures may leave the shared session unusable - rebuild next time
+        _reset_docker_client()
+        current_app.logger.warning("Simple Docker logs failed: %s", e)
         return None
+    return _DockerLogStream(first_chunk, logs_iter)
+
+
+class _DockerLogStream:
+    """Streamed Docker log chunks that release the Docker connection on close()."""
+
+    def __init__(self, first_chunk, logs_iter):
+        self._first_chunk = first_chunk
+        self._logs_iter = logs_iter
+
+    def __iter__(self):
+        """Yield the chunks, ending the stream quietly on read errors."""
+        yield self._first_chunk
+        try:
+            yield from self._logs_iter
+        except Exception as e:
+            current_app.logger.warning("Docker log stream interrupted: %s", e)
+        finally:
+            self.close()
+
+    def close(self):
+        """Close the underlying Docker stream; safe to call more than once."""
+        close = getattr(self._logs_iter, 'close', None)
+        if close is not None:
+            close()
+
+
+def _close_late_docker_stream(future):
+    """Done-callback for a Docker fetch that finished after its caller gave up on it."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    stream = future.result()
+    if stream is not None:
+        stream.close()
+
+
+def _get_fallback_pool():
+    """Return the shared fallback executor, creating it on first use."""
+    global _FALLBACK_POOL
+    if _FALLBACK_POOL is None:
+        with _FALLBACK_POOL_LOCK:
+            if _FALLBACK_POOL is None:
+                _FALLBACK_POOL = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix='ddc-log-fallback'
+                )
+    return _FALLBACK_POOL
+
+
+def _fallback_logs_response(container_name, label):
+    """Build a fallback response from Docker or the local log files, or None.
+
+    Docker gets at most ``_FALLBACK_TIMEOUT`` seconds; the file tail is read
+    inline afterwards, so it never queues behind stuck Docker fetches.
+    """
+    pool = _get_fallback_pool()
+    docker_future = pool.submit(copy_current_request_context(_simple_docker_logs), container_name)
+    try:
+        stream = docker_future.result(timeout=_FALLBACK_TIMEOUT)
+    except FutureTimeoutError:
+        current_app.logger.warning("Simple Docker logs timed out after %ss", _FALLBACK_TIMEOUT)
+        # Still queued behind stuck fetches: drop it. Already running: nobody
+        # will read the stream if the fetch still completes - close it then
+        if not docker_future.cancel():
+            docker_future.add_done_callback(_close_late_docker_stream)
+        stream = None
+
+    # Docker output takes precedence; the file tail is only used without it
+    if stream is not None:
+        body = chain((f"[{label}]\n".encode('utf-8'),), stream)
+        # Chunks are already bytes, so let Werkzeug hand them straight to the server
+        return Response(stream_with_context(body), mimetype='text/plain',
+                        direct_passthrough=True)
+    logs = _simple_read_logs()
+    if logs:
+        return Response(f"[{label}]\n{logs}", mimetype='text/plain')
+    return None
 
 
 @log_bp.route('/container_logs/<container_name>')
@@ -57,7 +291,7 @@ def get_container_logs(container_name):
     """Get container logs using ContainerLogService."""
     try:
         # Use ContainerLogService for business logic
-        from services.web.container_log_service import get_container_log_service, ContainerLogRequest
+        _require_log_service()
 
         service = get_container_log_service()
         request_obj = ContainerLogRequest(
@@ -72,110 +306,84 @@ def get_container_logs(container_name):
             return Response(result.content, mimetype='text/plain')
         else:
             # Log detailed error but return generic message to user
-            current_app.logger.warning(f"Container log request failed: {result.error}")
+            current_app.logger.warning("Container log request failed: %s", result.error)
             # Try simple fallback
-            logs = _simple_docker_logs(container_name) or _simple_read_logs()
-            if logs:
-                return Response(f"[Fallback mode]\n{logs}", mimetype='text/plain')
+            fallback = _fallback_logs_response(container_name, "Fallback mode")
+            if fallback is not None:
+                return fallback
             return Response(f"Failed to fetch container logs: {result.error}", status=result.status_code, mimetype='text/plain')
 
     except (ImportError, AttributeError, RuntimeError) as e:
         # Service dependency errors - try simple fallback
-        current_app.logger.error(f"Service error in get_container_logs route: {e}", exc_info=True)
-        logs = _simple_docker_logs(container_name) or _simple_read_logs()
-        if logs:
-            return Response(f"[Fallback mode - service error]\n{logs}", mimetype='text/plain')
+        current_app.logger.error("Service error in get_container_logs route: %s", e, exc_info=True)
+        fallback = _fallback_logs_response(container_name, "Fallback mode - service error")
+        if fallback is not None:
+            return fallback
         return Response(f"Service error: {str(e)}", status=500, mimetype='text/plain')
     except (ValueError, TypeError, KeyError) as e:
         # Data errors - try simple fallback
-        current_app.logger.error(f"Data error in get_container_logs route: {e}", exc_info=True)
-        logs = _simple_docker_logs(container_name) or _simple_read_logs()
-        if logs:
-            return Response(f"[Fallback mode - data error]\n{logs}", mimetype='text/plain')
+        current_app.logger.error("Data error in get_container_logs route: %s", e, exc_info=True)
+        fallback = _fallback_logs_response(container_name, "Fallback mode - data error")
+        if fallback is not None:
+            return fallback
         return Response(f"Data error: {str(e)}", status=500, mimetype='text/plain')
 
-@log_bp.route('/bot_logs')
-@auth.login_required
-def get_bot_logs():
-    """Get bot logs using ContainerLogService."""
+def _filtered_logs_response(log_type, label, no_logs_message):
+    """Serve one of the filtered log types (a ``LogType`` value).
+
+    Falls back to the raw log files when the service is unavailable or fails.
+    """
     try:
-        from services.web.container_log_service import get_container_log_service, FilteredLogRequest, LogType
+        _require_log_service()
         service = get_container_log_service()
-        request_obj = FilteredLogRequest(log_type=LogType.BOT, max_lines=500)
+        request_obj = FilteredLogRequest(log_type=LogType(log_type), max_lines=500)
         result = service.get_filtered_logs(request_obj)
         if result.success:
             return Response(result.content, mimetype='text/plain')
     except Exception as e:
-        current_app.logger.error(f"Bot logs error: {e}", exc_info=True)
+        current_app.logger.error("%s logs error: %s", label, e, exc_info=True)
 
-    # Fallback: try to read bot.log directly
-    logs = _simple_read_logs() or "No bot logs available"
+    # Fallback: try to read the log files directly
+    logs = _simple_read_logs_cached() or no_logs_message
     return Response(logs, mimetype='text/plain')
 
+@log_bp.route('/bot_logs')
+@auth.login_required
+def get_bot_logs():
+    """Get bot logs using ContainerLogService."""
+    return _filtered_logs_response('bot', "Bot", "No bot logs available")
+
 @log_bp.route('/discord_logs')
 @auth.login_required
 def get_discord_logs():
     """Get Discord logs using ContainerLogService."""
-    try:
-        from services.web.container_log_service import get_container_log_service, FilteredLogRequest, LogType
-        service = get_container_log_service()
-        request_obj = FilteredLogRequest(log_type=LogType.DISCORD, max_lines=500)
-        result = service.get_filtered_logs(request_obj)
-        if result.success:
-            return Response(result.content, mimetype='text/plain')
-    except Exception as e:
-        current_app.logger.error(f"Discord logs error: {e}", exc_info=True)
-
-    logs = _simple_read_logs() or "No Discord logs available"
-    return Response(logs, mimetype='text/plain')
+    return _filtered_logs_response('discord', "Discord", "No Discord logs available")
 
 @log_bp.route('/webui_logs')
 @auth.login_required
 def get_webui_logs():
     """Get Web UI logs using ContainerLogService."""
-    try:
-        from services.web.container_log_service import get_container_log_service, FilteredLogRequest, LogType
-        service = get_container_log_service()
-        request_obj = FilteredLogRequest(log_type=LogType.WEBUI, max_lines=500)
-        result = service.get_filtered_logs(request_obj)
-        if result.success:
-            return Response(result.content, mimetype='text/plain')
-    except Exception as e:
-        current_app.logger.error(f"WebUI logs error: {e}", exc_info=True)
-
-    logs = _simple_read_logs() or "No Web UI logs available"
-    return Response(logs, mimetype='text/plain')
+    return _filtered_logs_response('webui', "WebUI", "No Web UI logs available")
 
 @log_bp.route('/application_logs')
 @auth.login_required
 def get_application_logs():
     """Get application logs using ContainerLogService."""
-    try:
-        from services.web.container_log_service import get_container_log_service, FilteredLogRequest, LogType
-        service = get_container_log_service()
-        request_obj = FilteredLogRequest(log_type=LogType.APPLICATION, max_lines=500)
-        result = service.get_filtered_logs(request_obj)
-        if result.success:
-            return Response(result.content, mimetype='text/plain')
-    except Exception as e:
-        current_app.logger.error(f"Application logs error: {e}", exc_info=True)
-
-    logs = _simple_read_logs() or "No application logs available"
-    return Response(logs, mimetype='text/plain')
+    return _filtered_logs_response('application', "Application", "No application logs available")
 
 @log_bp.route('/action_logs')
 @auth.login_required
 def get_action_logs():
     """Get action logs using ContainerLogService."""
     try:
-        from services.web.container_log_service import get_container_log_service, ActionLogRequest
+        _require_log_service()
         service = get_container_log_service()
         request_obj = ActionLogRequest(format_type="text", limit=500)
         result = service.get_action_logs(request_obj)
         if result.success:
             return Response(result.content, mimetype='text/plain')
     except Exception as e:
-        current_app.logger.error(f"Action logs error: {e}", exc_info=True)
+        current_app.logger.error("Action logs error: %s", e, exc_info=True)
 
     return Response("No action logs available", mimetype='text/plain')
 
@@ -185,7 +393,7 @@ def get_action_logs_json():
     """Get action logs as JSON using ContainerLogService."""
     try:
         # Use ContainerLogService for business logic
-        from services.web.container_log_service import get_container_log_service, ActionLogRequest
+        _require_log_service()
 
         service = get_container_log_service()
         request_obj = ActionLogRequest(
@@ -197,19 +405,20 @@ def get_action_logs_json():
         result = service.get_action_logs(request_obj)
 
         if result.success:
-            return jsonify(result.data)
+            return _json_response(result.data)
         else:
             # Log detailed error but return generic message to user
-            current_app.logger.error(f"Action log JSON request failed: {result.error}")
+            current_app.logger.error("Action log JSON request failed: %s", result.error)
             return jsonify({'success': False, 'error': 'Failed to fetch action logs'}), result.status_code
 
     except (ImportError, AttributeError, RuntimeError) as e:
         # Service dependency errors (container_log_service unavailable, service method failures)
-        current_app.logger.error(f"Service error in get_action_logs_json route: {e}", exc_info=True)
+        current_app.logger.error("Service error in get_action_logs_json route: %s", e,
+                                 exc_info=True)
         return jsonify({'success': False, 'error': 'Service error occurred'}), 500
     except (ValueError, TypeError, KeyError) as e:
         # Data errors (invalid request parameters, response processing failures, JSON serialization)
-        current_app.logger.error(f"Data error in get_action_logs_json route: {e}", exc_info=True)
+        current_app.logger.error("Data error in get_action_logs_json route: %s", e, exc_info=True)
         return jsonify({'success': False, 'error': 'Data error occurred'}), 500
 
 @log_bp.route('/clear_logs', methods=['POST'])
@@ -218,7 +427,7 @@ def clear_logs():
     """Clear logs using ContainerLogService."""
     try:
         # Use ContainerLogService for business logic
-        from services.web.container_log_service import get_container_log_service, ClearLogRequest
+        _require_log_service()
 
         log_type = request.json.get('log_type', 'container') if request.json else 'container'
 
@@ -232,14 +441,14 @@ def clear_logs():
             return jsonify(result.data)
         else:
             # Log detailed error but return generic message to user
-            current_app.logger.error(f"Clear logs request failed: {result.error}")
+            current_app.logger.error("Clear logs request failed: %s", result.error)
             return jsonify({'success': False, 'message': 'Failed to clear logs'}), result.status_code
 
     except (ImportError, AttributeError, RuntimeError) as e:
         # Service dependency errors (container_log_service unavailable, service method failures)
-        current_app.logger.error(f"Service error in clear_logs route: {e}", exc_info=True)
+        current_app.logger.error("Service error in clear_logs route: %s", e, exc_info=True)
         return jsonify({'success': False, 'message': 'Service error occurred'}), 500
     except (ValueError, TypeError, KeyError) as e:
         # Data errors (invalid request parameters, response processing failures, JSON parsing)
-        current_app.logger.error(f"Data error in clear_logs route: {e}", exc_info=True)
+        current_app.logger.error("Data error in clear_logs route: %s", e, exc_info=True)
         return jsonify({'success': False, 'message': 'Data error occurred'}), 500
@@ -8,15 +8,18 @@ Demo Mode restrictions for public demo server.
 When DDC_MODE=demo is set, certain features are disabled to prevent abuse.
 """
 
+import json
 import os
 from functools import wraps
-from flask import jsonify, request
+from flask import Response, request
 
 # Demo Mode Configuration
 DEMO_MODE_ENABLED = os.environ.get('DDC_MODE') == 'demo'
 
 # Protected containers that cannot be controlled in demo mode
-PROTECTED_CONTAINERS = ['ddc', 'caddy']
+PROTECTED_CONTAINERS = ('ddc', 'caddy')
+# Hash set for O(1) membership checks in per-container loops
+_PROTECTED_SET = frozenset(PROTECTED_CONTAINERS)
 
 # Fixed monitored channel for AAS in demo mode
 DEMO_AAS_MONITORED_CHANNEL = '1443591386292289678'
@@ -33,9 +36,9 @@ def is_demo_mode():
 
 def is_protected_container(container_name):
     """Check if a container is protected in demo mode."""
-    if not is_demo_mode():
+    if not DEMO_MODE_ENABLED:
         return False
-    return container_name in PROTECTED_CONTAINERS
+    return container_name in _PROTECTED_SET
 
 
 def get_demo_notice(lang='en'):
@@ -49,18 +52,23 @@ def demo_restrict(feature_name='this feature'):
     """
     Decorator to restrict API endpoints in demo mode.
     Returns 403 with demo notice if demo mode is enabled.
+    Outside demo mode the endpoint is returned unwrapped.
     """
+    if not DEMO_MODE_ENABLED:
+        return lambda f: f
+
+    # The blocked response never changes, so serialize it once
+    payload = json.dumps({
+        'success': False,
+        'error': DEMO_NOTICE_EN,
+        'demo_mode': True,
+        'restricted_feature': feature_name
+    }).encode('utf-8')
+
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if is_demo_mode():
-                return jsonify({
-                    'success': False,
-                    'error': f'{DEMO_NOTICE_EN}',
-                    'demo_mode': True,
-                    'restricted_feature': feature_name
-                }), 403
-            return f(*args, **kwargs)
+            return Response(payload, status=403, mimetype='application/json')
         return decorated_function
     return decorator
 
@@ -69,30 +77,41 @@ def demo_restrict_container(f):
     """
     Decorator to restrict container actions for protected containers.
     Checks container_name in URL parameters or request data.
+    Outside demo mode the endpoint is returned unwrapped.
     """
+    if not DEMO_MODE_ENABLED:
+        return f
+
+    protected = _PROTECTED_SET
+    # Only protected names are ever rejected, so every possible body is known up front
+    blocked_payloads = {
+        name: json.dumps({
+            'success': False,
+            'error': f'Container "{name}" is protected on the demo server',
+            'demo_mode': True,
+            'protected_container': name
+        }).encode('utf-8')
+        for name in protected
+    }
+
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not is_demo_mode():
-            return f(*args, **kwargs)
-
-        # Check URL parameters
+        # Check URL parameters - when present the request body is never parsed
         container_name = kwargs.get('container_name') or kwargs.get('name')
-
+        if container_name:
+            if container_name not in protected:
+                return f(*args, **kwargs)
         # Check request data
-        if not container_name:
-            if request.is_json:
-                data = request.get_json(silent=True) or {}
+        elif request.is_json:
+            data = request.get_json(silent=True)
+            if isinstance(data, dict):
                 container_name = data.get('container_name') or data.get('container')
-            elif request.form:
-                container_name = request.form.get('container_name') or request.form.get('container')
+        elif request.form:
+            container_name = request.form.get('container_name') or request.form.get('container')
 
-        if container_name and is_protected_container(container_name):
-            return jsonify({
-                'success': False,
-                'error': f'Container "{container_name}" is protected on the demo server',
-                'demo_mode': True,
-                'protected_container': container_name
-            }), 403
+        if container_name and container_name in protected:
+            return Response(blocked_payloads[container_name], status=403,
+                            mimetype='application/json')
 
         return f(*args, **kwargs)
     return decorated_function
@@ -115,18 +134,20 @@ def filter_containers_for_demo(containers):
     """
     Filter container list for demo mode.
     Returns containers with protected flag added.
+    Container dicts are copied, so the caller's (often shared) dicts stay untouched.
     """
-    if not is_demo_mode():
+    if not DEMO_MODE_ENABLED:
         return containers
 
-    result = []
-    for container in containers:
-        container_copy = dict(container) if isinstance(container, dict) else container
-        name = container_copy.get('name') or container_copy.get('container_name', '')
-        if isinstance(container_copy, dict):
-            container_copy['demo_protected'] = name in PROTECTED_CONTAINERS
-        result.append(container_copy)
-    return result
+    protected = _PROTECTED_SET
+
+    def _tag(container):
+        if not isinstance(container, dict):
+            return container
+        name = container.get('name') or container.get('container_name', '')
+        return {**container, 'demo_protected': name in protected}
+
+    return [_tag(container) for container in containers]
 
 
 def get_allowed_task_containers(all_containers):
@@ -134,8 +155,9 @@ def get_allowed_task_containers(all_containers):
     Get list of containers that can be targeted by tasks in demo mode.
     Excludes protected containers.
     """
-    if not is_demo_mode():
+    if not DEMO_MODE_ENABLED:
         return all_containers
 
+    protected = _PROTECTED_SET
     return [c for c in all_containers
-            if (c.get('name') or c.get('container_name', '')) not in PROTECTED_CONTAINERS]
+            if (c.get('name') or c.get('container_name', '')) not in protected]
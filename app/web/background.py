@@ -13,6 +13,7 @@ import os
 
 from flask import Flask
 
+from app.demo_mode import is_demo_mode
 from app.utils.shared_data import load_active_containers_from_config
 from app.utils.web_helpers import (
     start_background_refresh,
@@ -31,14 +32,23 @@ def _is_enabled(var_name: str) -> bool:
     return os.environ.get(var_name, "true").lower() != "false"
 
 
+def _load_active_containers(logger) -> None:
+    active_containers = load_active_containers_from_config()
+    logger.info("Loaded %d active containers: %s", len(active_containers), active_containers)
+
+
 def register_background_services(app: Flask) -> None:
     """Start background helpers and register teardown hooks."""
     apply_gevent_fork_workaround(app.logger)
 
+    # Resolve environment toggles once per app start instead of per check
+    background_refresh_enabled = _is_enabled("DDC_ENABLE_BACKGROUND_REFRESH")
+    mech_decay_enabled = _is_enabled("DDC_ENABLE_MECH_DECAY")
+
     with app.app_context():
         app.logger.info("Starting Docker cache background refresh thread")
 
-        if _is_enabled("DDC_ENABLE_BACKGROUND_REFRESH"):
+        if background_refresh_enabled:
             if HAS_GEVENT:
                 spawn_delayed(2.0, start_background_refresh, app.logger)
             else:
@@ -46,11 +56,11 @@ def register_background_services(app: Flask) -> None:
         else:
             app.logger.info("Background Docker cache refresh disabled by environment setting")
 
+        # Config I/O doesn't need to block app start-up
         app.logger.info("Loading active containers from config")
-        active_containers = load_active_containers_from_config()
-        app.logger.info("Loaded %d active containers: %s", len(active_containers), active_containers)
+        spawn_delayed(0.0, _load_active_containers, app.logger)
 
-        if _is_enabled("DDC_ENABLE_MECH_DECAY"):
+        if mech_decay_enabled:
             if HAS_GEVENT:
                 spawn_delayed(2.0, start_mech_decay_background, app.logger)
             else:
@@ -60,7 +70,7 @@ def register_background_services(app: Flask) -> None:
 
         # Start Demo Reset Service (only in demo mode)
         global _demo_reset_service
-        if os.environ.get('DDC_MODE') == 'demo':
+        if is_demo_mode():
             try:
                 from services.demo.demo_reset_service import get_demo_reset_service
                 _demo_reset_service = get_demo_reset_service()
@@ -3616,6 +3616,11 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
         if hasattr(self, 'periodic_message_edit_loop') and self.periodic_message_edit_loop.is_running(): self.periodic_message_edit_loop.cancel()
         if hasattr(self, 'inactivity_check_loop') and self.inactivity_check_loop.is_running(): self.inactivity_check_loop.cancel()
         if hasattr(self, 'performance_cache_clear_loop') and self.performance_cache_clear_loop.is_running(): self.performance_cache_clear_loop.cancel()
+        if hasattr(self, 'demo_update_messages_task'):
+            # The service outlives the cog; stop it so a reload starts a single fresh sender
+            self.demo_update_messages_task.cancel()
+            from services.demo.demo_update_messages_service import stop_demo_update_messages_service
+            self.bot.loop.create_task(stop_demo_update_messages_service())
         logger.info("All direct Cog loops cancellation attempted.")
 
         # PERFORMANCE OPTIMIZATION: Clear all caches on unload
@@ -4785,58 +4790,13 @@ def setup(bot):
         cog.demo_hourly_cleanup = demo_hourly_cleanup
         logger.info("Demo mode: Hourly reset notification task started for all configured channels")
 
-        # Start demo update messages task loop
-        from services.demo.demo_update_messages_service import DEMO_UPDATE_MESSAGES, DISCLAIMER, UPDATE_CHANNEL_ID
-        import random
-
-        @tasks.loop(seconds=60)
-        async def demo_update_messages_loop():
-            """Send demo update messages to the update channel throughout each hour."""
-            try:
-                from datetime import datetime
-                now = datetime.now()
-
-                # Initialize state if needed
-                if not hasattr(demo_update_messages_loop, '_current_hour'):
-                    demo_update_messages_loop._current_hour = -1
-                    demo_update_messages_loop._messages_sent = 0
-                    demo_update_messages_loop._next_send_minute = random.randint(1, 5)
-
-                # Reset at start of each hour
-                if now.hour != demo_update_messages_loop._current_hour:
-                    demo_update_messages_loop._current_hour = now.hour
-                    demo_update_messages_loop._messages_sent = 0
-                    demo_update_messages_loop._next_send_minute = random.randint(1, 5)
-                    logger.info(f"Demo update messages: New hour {now.hour}:00 - reset counter, first message at :{demo_update_messages_loop._next_send_minute:02d}")
-
-                # Check if it's time to send a message (max 12 per hour)
-                if demo_update_messages_loop._messages_sent < 12 and now.minute >= demo_update_messages_loop._next_send_minute:
-                    channel = bot.get_channel(UPDATE_CHANNEL_ID)
-                    if channel:
-                        # Pick a random message
-                        message_data = random.choice(DEMO_UPDATE_MESSAGES)
-                        timestamp = now.strftime("%d.%m.%y, %H:%M")
-
-                        full_message = f"**{message_data['title']}**\n"
-                        full_message += f"— {timestamp}\n\n"
-                        full_message += message_data['content']
-                        full_message += DISCLAIMER
-
-                        await channel.send(full_message)
-                        demo_update_messages_loop._messages_sent += 1
-
-                        # Schedule next message (random 1-10 minutes from now)
-                        next_interval = random.randint(1, 10)
-                        demo_update_messages_loop._next_send_minute = min(59, now.minute + next_interval)
-
-                        logger.info(f"Demo update message #{demo_update_messages_loop._messages_sent}/12 sent ({message_data['container']}), next at :{demo_update_messages_loop._next_send_minute:02d}")
-
-            except Exception as e:
-                logger.error(f"Demo update messages loop error: {e}", exc_info=True)
-
-        demo_update_messages_loop.start()
-        cog.demo_update_messages_loop = demo_update_messages_loop
-        logger.info("Demo mode: Update messages loop started for update channel")
+        # Start demo update messages service (per-hour shuffled schedule, cached channel).
+        # The handle lets cog_unload cancel a start that hasn't run yet.
+        from services.demo.demo_update_messages_service import start_demo_update_messages_service
+        cog.demo_update_messages_task = bot.loop.create_task(
+            start_demo_update_messages_service(bot)
+        )
+        logger.info("Demo mode: Update messages service scheduled for update channel")
 
     bot.add_cog(cog)
     logger.info("[SETUP DEBUG] DockerControlCog added to bot")
@@ -10,16 +10,28 @@ Configuration Cache Service - Handles config caching and token encryption cachin
 Part of ConfigService refactoring for Single Responsibility Principle
 """
 
-import hashlib
 import logging
 import os
 from pathlib import Path
 from threading import Lock
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger('ddc.config_cache')
 
 
+def _clone_config(value: Any) -> Any:
+    """Recursively copy the dict/list structure of JSON-style config data.
+
+    Much cheaper than copy.deepcopy() because it skips the memo bookkeeping
+    and leaves immutable leaves (str, int, float, bool, None) shared.
+    """
+    if isinstance(value, dict):
+        return {key: _clone_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_config(item) for item in value]
+    return value
+
+
 class ConfigCacheService:
     """
     Handles all configuration caching operations.
@@ -39,7 +51,8 @@ class ConfigCacheService:
 
         # Token encryption cache
         self._token_cache: Optional[str] = None
-        self._token_cache_hash: Optional[str] = None
+        # (encrypted_token, password_hash) the cached token was decrypted from
+        self._token_cache_key: Optional[Tuple[str, str]] = None
 
     def get_cached_config(self, cache_key: str, config_dir: Path) -> Optional[Dict[str, Any]]:
         """
@@ -52,45 +65,33 @@ class ConfigCacheService:
         Returns:
             Cached config dict if valid, None otherwise
         """
-        with self._cache_lock:
-            # Check the .config_updated timestamp file for cross-process invalidation
-            timestamp_file = config_dir / '.config_updated'
-            if timestamp_file.exists():
-                current_time = os.path.getmtime(timestamp_file)
-            else:
-                # Fallback: check max mtime of all json files in config dir
-                current_time = self._get_max_config_mtime(config_dir)
+        # Stat outside the lock so concurrent readers don't serialize on disk I/O.
+        # The .config_updated timestamp file provides cross-process invalidation
+        current_time = self._get_timestamp_mtime(config_dir)
 
+        with self._cache_lock:
             if (cache_key in self._config_cache and
                 self._cache_timestamps.get(cache_key, 0) >= current_time):
-                return self._config_cache[cache_key].copy()
+                cached = self._config_cache[cache_key]
+            else:
+                return None
 
-            return None
+        # Callers edit the returned config in place before saving; hand out a
+        # detached copy so those edits can't leak to later readers
+        return _clone_config(cached)
 
-    def _get_max_config_mtime(self, config_dir: Path) -> float:
-        """Get the maximum modification time of all config files."""
-        max_mtime = 0.0
+    def _get_timestamp_mtime(self, config_dir: Path) -> float:
+        """Get the mtime of ``.config_updated``, the cross-process invalidation marker."""
+        timestamp_file = config_dir / '.config_updated'
         try:
-            # Check main config files
-            for json_file in config_dir.glob('*.json'):
-                try:
-                    mtime = os.path.getmtime(json_file)
-                    max_mtime = max(max_mtime, mtime)
-                except OSError:
-                    pass
-            # Check subdirectories (containers, channels)
-            for subdir in ['containers', 'channels']:
-                subdir_path = config_dir / subdir
-                if subdir_path.exists():
-                    for json_file in subdir_path.glob('*.json'):
-                        try:
-                            mtime = os.path.getmtime(json_file)
-                            max_mtime = max(max_mtime, mtime)
-                        except OSError:
-                            pass
+            return os.path.getmtime(timestamp_file)
+        except FileNotFoundError:
+            # invalidate_cache() creates the file on first use - no invalidation yet
+            return 0.0
         except OSError:
-            pass
-        return max_mtime
+            # The marker exists but can't be read, so changes can't be detected -
+            # never serve from cache
+            return float('inf')
 
     def set_cached_config(self, cache_key: str, config: Dict[str, Any], config_dir: Path) -> None:
         """
@@ -101,9 +102,12 @@ class ConfigCacheService:
             config: Configuration data to cache
             config_dir: Config directory to get modification time
         """
+        current_time = os.path.getmtime(config_dir) if config_dir.exists() else 0
+        snapshot = _clone_config(config)
         with self._cache_lock:
-            current_time = os.path.getmtime(config_dir) if config_dir.exists() else 0
-            self._config_cache[cache_key] = config.copy()
+            # Detach the snapshot from the caller's dict so later in-place edits of
+            # nested containers/channels can't leak into the cache
+            self._config_cache[cache_key] = snapshot
             self._cache_timestamps[cache_key] = current_time
 
     def invalidate_cache(self, config_dir: Path = None) -> None:
@@ -112,7 +116,7 @@ class ConfigCacheService:
             self._config_cache.clear()
             self._cache_timestamps.clear()
             self._token_cache = None
-            self._token_cache_hash = None
+            self._token_cache_key = None
 
         # Touch the timestamp file for cross-process cache invalidation
         if config_dir:
@@ -125,9 +129,9 @@ class ConfigCacheService:
         try:
             timestamp_file = config_dir / '.config_updated'
             timestamp_file.touch()
-            logger.debug(f"Touched timestamp file: {timestamp_file}")
+            logger.debug("Touched timestamp file: %s", timestamp_file)
         except OSError as e:
-            logger.warning(f"Failed to touch timestamp file: {e}")
+            logger.warning("Failed to touch timestamp file: %s", e)
 
     def get_cached_token(self, encrypted_token: str, password_hash: str) -> Optional[str]:
         """
@@ -140,9 +144,7 @@ class ConfigCacheService:
         Returns:
             Decrypted token if cached, None otherwise
         """
-        cache_key = hashlib.sha256(f"{encrypted_token}{password_hash}".encode()).hexdigest()
-
-        if self._token_cache_hash == cache_key and self._token_cache:
+        if self._token_cache and self._token_cache_key == (encrypted_token, password_hash):
             logger.debug("Token cache hit")
             return self._token_cache
 
@@ -157,13 +159,12 @@ class ConfigCacheService:
             password_hash: Password hash used for encryption
             decrypted_token: Decrypted token to cache
         """
-        cache_key = hashlib.sha256(f"{encrypted_token}{password_hash}".encode()).hexdigest()
         self._token_cache = decrypted_token
-        self._token_cache_hash = cache_key
+        self._token_cache_key = (encrypted_token, password_hash)
         logger.debug("Token cached successfully")
 
     def clear_token_cache(self) -> None:
         """Clear token cache only."""
         self._token_cache = None
-        self._token_cache_hash = None
+        self._token_cache_key = None
         logger.debug("Token cache cleared")
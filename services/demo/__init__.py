@@ -1,2 +1,15 @@
 # -*- coding: utf-8 -*-
 # Demo Services Package
+
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def is_demo_mode() -> bool:
+    """Check if running in demo mode (DDC_MODE=demo).
+
+    The environment is read once per process; call is_demo_mode.cache_clear()
+    after changing DDC_MODE (e.g. in tests).
+    """
+    return os.environ.get('DDC_MODE') == 'demo'
@@ -15,22 +15,55 @@ This service:
 3. Only active when DDC_MODE=demo
 """
 
+import asyncio
 import json
 import logging
 import os
 import shutil
 import threading
-import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from services.demo import is_demo_mode
+from utils.import_utils import import_orjson
+
+# orjson parses and serializes the packed defaults snapshot considerably faster
+orjson, _HAS_ORJSON = import_orjson()
+if _HAS_ORJSON:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
 
 logger = logging.getLogger('ddc.demo_reset_service')
 
 # Demo reset constants
 DEMO_DEFAULTS_DIR = "demo_defaults"
+
+# Project paths, resolved once per process
+_BASE_DIR = Path(__file__).resolve().parents[2]  # Go up to project root
+_CONFIG_DIR = _BASE_DIR / "config"
+_DEFAULTS_DIR = _CONFIG_DIR / DEMO_DEFAULTS_DIR
 CONFIG_DIRS_TO_BACKUP = ["containers", "channels"]
 CONFIG_FILES_TO_BACKUP = ["config.json", "tasks.json"]
+# Everything that is backed up, as (name, is_dir)
+BACKUP_PLAN = (
+    [(f, False) for f in CONFIG_FILES_TO_BACKUP]
+    + [(d, True) for d in CONFIG_DIRS_TO_BACKUP]
+)
+_BACKUP_KINDS = dict(BACKUP_PLAN)
+
+# Packed copy of all default files, used to warm the restore cache after a restart
+SNAPSHOT_FILE = ".defaults.pack.json"
 RESET_HOUR_MINUTE = 0  # Reset at :00 of every hour
 
 # Containers to stop during hourly reset (simulates "offline" game servers)
@@ -39,10 +72,100 @@ CONTAINERS_TO_STOP_ON_RESET = ["minecraft", "valheim"]
 # Protected admin user ID (never removed during reset)
 PROTECTED_ADMIN_USER_ID = "766595606574530581"
 
+# Linux ioctl request for sharing extents between files (reflink, btrfs/XFS)
+_FICLONE = 0x40049409
 
-def is_demo_mode() -> bool:
-    """Check if running in demo mode."""
-    return os.environ.get('DDC_MODE') == 'demo'
+
+def _fast_clone(src, dst) -> None:
+    """Copy a single file, letting the kernel share or copy the data where possible.
+
+    Tries a reflink (FICLONE) first, then an in-kernel copy_file_range, and
+    finally falls back to shutil.copy2. Metadata is copied like copy2 in all cases.
+    """
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            cloned = False
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                    cloned = True
+                except OSError:
+                    pass
+            if not cloned and hasattr(os, 'copy_file_range'):
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                cloned = remaining == 0
+        if cloned:
+            shutil.copystat(src, dst)
+            return
+    except OSError:
+        pass
+    shutil.copy2(src, dst)
+
+
+def _sync_tree(src_dir, dst_dir, copy_file: Optional[Callable] = None) -> None:
+    """Make dst_dir mirror src_dir in place, without removing dst_dir itself.
+
+    Entries are compared by (st_size, st_mtime_ns) from the cached scandir stat,
+    so only files that differ are copied and only stale entries are deleted.
+    copy_file(src, dst) defaults to _fast_clone.
+    """
+    copy_file = copy_file or _fast_clone
+    os.makedirs(dst_dir, exist_ok=True)
+    with os.scandir(src_dir) as it:
+        src_entries = {entry.name: entry for entry in it}
+    with os.scandir(dst_dir) as it:
+        dst_entries = {entry.name: entry for entry in it}
+
+    for name, entry in list(dst_entries.items()):
+        src_entry = src_entries.get(name)
+        if src_entry is not None and src_entry.is_dir() == entry.is_dir(follow_symlinks=False):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+        del dst_entries[name]
+
+    # Copy in inode order, which roughly follows the on-disk layout of the source
+    for entry in sorted(src_entries.values(), key=lambda e: e.inode()):
+        name = entry.name
+        dst_path = os.path.join(dst_dir, name)
+        if entry.is_dir():
+            _sync_tree(entry.path, dst_path, copy_file)
+            continue
+        dst_entry = dst_entries.get(name)
+        if dst_entry is not None:
+            src_stat = entry.stat()
+            dst_stat = dst_entry.stat(follow_symlinks=False)
+            if (src_stat.st_size, src_stat.st_mtime_ns) == (dst_stat.st_size, dst_stat.st_mtime_ns):
+                continue
+        copy_file(entry.path, dst_path)
+
+
+def _walk_files(directory, prefix):
+    """Yield (relative path, DirEntry) for every file below directory, recursively."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            rel_path = os.path.join(prefix, entry.name)
+            if entry.is_dir():
+                yield from _walk_files(entry.path, rel_path)
+            else:
+                yield rel_path, entry
+
+
+def _iter_backup_entries(directory):
+    """Yield (DirEntry, is_dir) for the backed-up files and directories found in directory."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            is_dir = _BACKUP_KINDS.get(entry.name)
+            if is_dir is not None and (entry.is_dir() if is_dir else entry.is_file()):
+                yield entry, is_dir
 
 
 class DemoResetService:
@@ -50,12 +173,19 @@ class DemoResetService:
 
     def __init__(self):
         """Initialize the Demo Reset Service."""
-        self.running = False
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self.thread: Optional[threading.Thread] = None
-        self.base_dir = Path(__file__).parents[2]  # Go up to project root
-        self.config_dir = self.base_dir / "config"
-        self.defaults_dir = self.config_dir / DEMO_DEFAULTS_DIR
-        self.last_reset_hour = -1
+        self.base_dir = _BASE_DIR
+        self.config_dir = _CONFIG_DIR
+        self.defaults_dir = _DEFAULTS_DIR
+        # Default file contents keyed by path, with the mtime_ns they were read at
+        self._defaults_cache: Dict[str, Tuple[int, bytes]] = {}
+
+    @property
+    def running(self) -> bool:
+        """Whether the reset loop is active."""
+        return not self._stop_event.is_set()
 
     def start(self) -> bool:
         """Start the Demo Reset Service."""
@@ -70,7 +200,7 @@ class DemoResetService:
         # Ensure defaults are saved on first start
         self._ensure_defaults_exist()
 
-        self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._run_service, daemon=True)
         self.thread.start()
         logger.info("Demo Reset Service started - will reset config every hour at :00")
@@ -81,34 +211,41 @@ class DemoResetService:
         if not self.running:
             return False
 
-        self.running = False
+        # Setting the event wakes the loop out of its wait immediately
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=5)
         logger.info("Demo Reset Service stopped")
         return True
 
+    @staticmethod
+    def _next_reset_time(now: datetime) -> datetime:
+        """Return the first reset instant (:RESET_HOUR_MINUTE) strictly after now."""
+        next_reset = now.replace(minute=RESET_HOUR_MINUTE, second=0, microsecond=0)
+        if next_reset <= now:
+            next_reset += timedelta(hours=1)
+        return next_reset
+
     def _run_service(self):
-        """Main service loop - checks every minute if reset is needed."""
+        """Main service loop - sleeps until the next full hour, then resets."""
         logger.info("Demo Reset Service loop started")
 
-        while self.running:
+        next_reset = self._next_reset_time(datetime.now())
+        while not self._stop_event.is_set():
             try:
-                now = datetime.now()
-                current_hour = now.hour
-                current_minute = now.minute
-
-                # Reset at the top of every hour (minute 0)
-                if current_minute == RESET_HOUR_MINUTE and current_hour != self.last_reset_hour:
-                    logger.info(f"Hourly reset triggered at {now.strftime('%H:%M')}")
-                    self._reset_to_defaults()
-                    self.last_reset_hour = current_hour
+                delay = max(0.0, (next_reset - datetime.now()).total_seconds())
+                if self._stop_event.wait(timeout=delay):
+                    break
 
-                # Sleep for 30 seconds before next check
-                time.sleep(30)
+                logger.info("Hourly reset triggered at %s", next_reset.strftime('%H:%M'))
+                self._reset_to_defaults()
 
             except Exception as e:
-                logger.error(f"Error in Demo Reset Service loop: {e}", exc_info=True)
-                time.sleep(60)  # Wait longer on error
+                logger.error("Error in Demo Reset Service loop: %s", e, exc_info=True)
+                self._stop_event.wait(timeout=60)  # Wait longer on error
+
+            # Schedule from the slot that just ran so an early wake-up can't reset twice
+            next_reset = self._next_reset_time(max(datetime.now(), next_reset))
 
     def _ensure_defaults_exist(self):
         """Ensure demo defaults are saved. Creates them if they don't exist."""
@@ -116,40 +253,35 @@ class DemoResetService:
             logger.info("Creating demo defaults for the first time")
             self._save_current_as_defaults()
         else:
-            logger.info(f"Demo defaults already exist at {self.defaults_dir}")
+            logger.info("Demo defaults already exist at %s", self.defaults_dir)
 
     def _save_current_as_defaults(self):
         """Save current configuration as demo defaults."""
+        self._defaults_cache.clear()
         try:
             # Create defaults directory
             self.defaults_dir.mkdir(parents=True, exist_ok=True)
 
-            # Backup config files
-            for filename in CONFIG_FILES_TO_BACKUP:
-                src = self.config_dir / filename
-                dst = self.defaults_dir / filename
-                if src.exists():
-                    shutil.copy2(src, dst)
-                    logger.info(f"Saved default: {filename}")
-
-            # Backup config directories
-            for dirname in CONFIG_DIRS_TO_BACKUP:
-                src_dir = self.config_dir / dirname
-                dst_dir = self.defaults_dir / dirname
-                if src_dir.exists():
-                    if dst_dir.exists():
-                        shutil.rmtree(dst_dir)
-                    shutil.copytree(src_dir, dst_dir)
-                    logger.info(f"Saved default directory: {dirname}")
+            # Backup config files and directories in a single pass over config/
+            for entry, is_dir in _iter_backup_entries(self.config_dir):
+                dst = os.path.join(self.defaults_dir, entry.name)
+                if is_dir:
+                    _sync_tree(entry.path, dst)
+                    logger.info("Saved default directory: %s", entry.name)
+                else:
+                    _fast_clone(entry.path, dst)
+                    logger.info("Saved default: %s", entry.name)
 
             # Create a timestamp file
             timestamp_file = self.defaults_dir / ".defaults_created"
             timestamp_file.write_text(datetime.now().isoformat())
 
+            self._write_snapshot()
+
             logger.info("Demo defaults saved successfully")
 
         except Exception as e:
-            logger.error(f"Failed to save demo defaults: {e}", exc_info=True)
+            logger.error("Failed to save demo defaults: %s", e, exc_info=True)
 
     def _stop_demo_containers(self):
         """Stop specific containers during demo reset (simulates offline game servers)."""
@@ -162,17 +294,17 @@ class DemoResetService:
                     container = client.containers.get(container_name)
                     if container.status == 'running':
                         container.stop(timeout=5)
-                        logger.info(f"Stopped container '{container_name}' for demo reset")
+                        logger.info("Stopped container '%s' for demo reset", container_name)
                     else:
-                        logger.debug(f"Container '{container_name}' already stopped")
+                        logger.debug("Container '%s' already stopped", container_name)
                 except docker.errors.NotFound:
-                    logger.debug(f"Container '{container_name}' not found - skipping")
+                    logger.debug("Container '%s' not found - skipping", container_name)
                 except Exception as e:
-                    logger.warning(f"Failed to stop container '{container_name}': {e}")
+                    logger.warning("Failed to stop container '%s': %s", container_name, e)
 
             client.close()
         except Exception as e:
-            logger.error(f"Error stopping demo containers: {e}", exc_info=True)
+            logger.error("Error stopping demo containers: %s", e, exc_info=True)
 
     def _reset_to_defaults(self):
         """Reset configuration to demo defaults."""
@@ -186,25 +318,20 @@ class DemoResetService:
 
             reset_count = 0
 
-            # Restore config files
-            for filename in CONFIG_FILES_TO_BACKUP:
-                src = self.defaults_dir / filename
-                dst = self.config_dir / filename
-                if src.exists():
-                    shutil.copy2(src, dst)
-                    reset_count += 1
-                    logger.debug(f"Restored: {filename}")
-
-            # Restore config directories
-            for dirname in CONFIG_DIRS_TO_BACKUP:
-                src_dir = self.defaults_dir / dirname
-                dst_dir = self.config_dir / dirname
-                if src_dir.exists():
-                    if dst_dir.exists():
-                        shutil.rmtree(dst_dir)
-                    shutil.copytree(src_dir, dst_dir)
-                    reset_count += 1
-                    logger.debug(f"Restored directory: {dirname}")
+            # After a restart, warm the in-memory defaults from one packed file
+            if not self._defaults_cache:
+                self._load_snapshot()
+
+            # Restore config files and directories in a single pass over the defaults
+            for entry, is_dir in _iter_backup_entries(self.defaults_dir):
+                dst = self.config_dir / entry.name
+                if is_dir:
+                    self._swap_in_tree(entry.path, dst)
+                    logger.debug("Restored directory: %s", entry.name)
+                else:
+                    self._restore_file(entry.path, dst)
+                    logger.debug("Restored: %s", entry.name)
+                reset_count += 1
 
             # Reset admin users to only protected user
             self._reset_admin_users()
@@ -212,10 +339,96 @@ class DemoResetService:
             # Touch the config update timestamp for cache invalidation
             self._touch_config_timestamp()
 
-            logger.info(f"Demo reset complete - restored {reset_count} items")
+            logger.info("Demo reset complete - restored %d items", reset_count)
 
         except Exception as e:
-            logger.error(f"Failed to reset to demo defaults: {e}", exc_info=True)
+            logger.error("Failed to reset to demo defaults: %s", e, exc_info=True)
+
+    def _write_snapshot(self) -> None:
+        """Pack every backed-up default file into SNAPSHOT_FILE and the in-memory cache.
+
+        The snapshot maps paths relative to the defaults directory to
+        [mtime_ns, text]; the file tree itself stays the source of truth.
+        """
+        files = {}
+        for entry, is_dir in _iter_backup_entries(self.defaults_dir):
+            entries = _walk_files(entry.path, entry.name) if is_dir else [(entry.name, entry)]
+            for rel_path, file_entry in entries:
+                mtime_ns = file_entry.stat().st_mtime_ns
+                with open(file_entry.path, 'rb') as f:
+                    data = f.read()
+                self._defaults_cache[file_entry.path] = (mtime_ns, data)
+                try:
+                    files[rel_path] = [mtime_ns, data.decode('utf-8')]
+                except UnicodeDecodeError:
+                    continue  # Not text; restored from disk instead
+
+        snapshot_file = self.defaults_dir / SNAPSHOT_FILE
+        temp_file = snapshot_file.with_name(snapshot_file.name + '.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(_dumps({"files": files}))
+        os.replace(temp_file, snapshot_file)
+        logger.debug("Packed %d default files into %s", len(files), SNAPSHOT_FILE)
+
+    def _load_snapshot(self) -> None:
+        """Fill the in-memory defaults cache from SNAPSHOT_FILE with a single read."""
+        snapshot_file = self.defaults_dir / SNAPSHOT_FILE
+        try:
+            with open(snapshot_file, 'rb') as f:
+                if hasattr(os, 'posix_fadvise'):
+                    # One sequential read of the whole snapshot; let the kernel read ahead
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                files = _loads(f.read())["files"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("No usable defaults snapshot (%s) - reading default files individually", e)
+            return
+
+        # Entries whose mtime no longer matches are ignored by _restore_file and re-read
+        for rel_path, (mtime_ns, text) in files.items():
+            full_path = os.path.join(self.defaults_dir, rel_path)
+            self._defaults_cache[full_path] = (mtime_ns, text.encode('utf-8'))
+
+    def _swap_in_tree(self, src_dir, dst_dir: Path) -> None:
+        """Replace dst_dir with a copy of src_dir via a staging directory and renames.
+
+        The live directory is never partially restored: the defaults are synced
+        into ".<name>.new" first and then renamed into place. The previous tree
+        is kept as ".<name>.old" and recycled as the next reset's staging
+        directory, so only files changed since then have to be rewritten.
+        """
+        staging = dst_dir.with_name(f".{dst_dir.name}.new")
+        previous = dst_dir.with_name(f".{dst_dir.name}.old")
+
+        if previous.exists():
+            if staging.exists():
+                # Left over from an interrupted reset; the staging tree is resynced anyway
+                shutil.rmtree(previous)
+            else:
+                os.rename(previous, staging)
+
+        _sync_tree(src_dir, staging, self._restore_file)
+
+        if dst_dir.exists():
+            os.rename(dst_dir, previous)
+        os.rename(staging, dst_dir)
+
+    def _restore_file(self, src, dst) -> None:
+        """Write a default file back from memory, reading it from disk only when it changed.
+
+        The destination gets the source's timestamps so unchanged files are
+        skipped by _sync_tree on the next reset.
+        """
+        key = os.fspath(src)
+        src_stat = os.stat(key)
+        cached = self._defaults_cache.get(key)
+        if cached is None or cached[0] != src_stat.st_mtime_ns:
+            with open(key, 'rb') as f:
+                cached = (src_stat.st_mtime_ns, f.read())
+            self._defaults_cache[key] = cached
+
+        with open(dst, 'wb') as f:
+            f.write(cached[1])
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
 
     def _touch_config_timestamp(self):
         """Touch the config timestamp file for cross-process cache invalidation."""
@@ -224,7 +437,7 @@ class DemoResetService:
             timestamp_file.touch()
             logger.debug("Touched config timestamp for cache invalidation")
         except Exception as e:
-            logger.warning(f"Failed to touch config timestamp: {e}")
+            logger.warning("Failed to touch config timestamp: %s", e)
 
     def _reset_admin_users(self):
         """Reset admin users to only the protected user."""
@@ -243,10 +456,11 @@ class DemoResetService:
             with open(admins_file, 'w') as f:
                 json.dump(admin_data, f, indent=2)
 
-            logger.info(f"Reset admin users - only protected user {PROTECTED_ADMIN_USER_ID} remains")
+            logger.info("Reset admin users - only protected user %s remains",
+                        PROTECTED_ADMIN_USER_ID)
 
         except Exception as e:
-            logger.error(f"Failed to reset admin users: {e}", exc_info=True)
+            logger.error("Failed to reset admin users: %s", e, exc_info=True)
 
     def force_reset(self) -> bool:
         """Force an immediate reset to defaults (for manual triggering)."""
@@ -268,6 +482,15 @@ class DemoResetService:
         self._save_current_as_defaults()
         return True
 
+    async def async_force_reset(self) -> bool:
+        """force_reset() for use on an event loop; file I/O runs in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.force_reset)
+
+    async def async_save_current_as_new_defaults(self) -> bool:
+        """save_current_as_new_defaults() for use on an event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.save_current_as_new_defaults)
+
 
 # Singleton instance
 _service_instance: Optional[DemoResetService] = None
@@ -11,28 +11,38 @@ Demo Update Messages Service - Sends realistic-looking update messages to the up
 
 This service:
 1. Sends 12 different demo update messages throughout each hour
-2. Messages are sent at random intervals (max 10 minutes between messages)
+2. Send times are drawn at random once per hour and sent in order
 3. Each message includes a disclaimer that it's a demo message
 4. Only active when DDC_MODE=demo
 """
 
 import asyncio
+import bisect
 import logging
-import os
 import random
 from datetime import datetime
-from typing import Optional, List
+from typing import List, Optional, Tuple
+
+from services.demo import is_demo_mode
 
 logger = logging.getLogger('ddc.demo_update_messages')
 
-# Demo mode check
-DEMO_MODE = os.environ.get('DDC_MODE') == 'demo'
+# Messages sent per hour, at times drawn once at the start of each hour
+MESSAGES_PER_HOUR = 12
+SECONDS_PER_HOUR = 3600
+
+# Discord's per-message length limit, used when overdue messages are sent together
+DISCORD_MESSAGE_LIMIT = 2000
+MESSAGE_SEPARATOR = "\n\n"
 
 # Update channel ID for demo
 UPDATE_CHANNEL_ID = 1443591386292289678
 
 # Disclaimer text
-DISCLAIMER = "\n\n-# ⚠️ *This is a DEMO message for testing purposes only. It does not reflect real events or actual software updates.*"
+DISCLAIMER = (
+    "\n\n-# ⚠️ *This is a DEMO message for testing purposes only. "
+    "It does not reflect real events or actual software updates.*"
+)
 
 # 12 Demo update messages for different containers (max 5 lines each)
 DEMO_UPDATE_MESSAGES = [
@@ -122,6 +132,23 @@ No restart required. ✅"""
     }
 ]
 
+# Fully rendered messages with only the timestamp left open: (container, template).
+# Literal braces are escaped so str.format only ever fills {ts}.
+DEMO_UPDATE_TEMPLATES: List[Tuple[str, str]] = [
+    (
+        entry["container"],
+        "**{title}**\n— {{ts}}\n\n{content}{disclaimer}".format(
+            title=entry["title"].replace("{", "{{").replace("}", "}}"),
+            content=entry["content"].replace("{", "{{").replace("}", "}}"),
+            disclaimer=DISCLAIMER.replace("{", "{{").replace("}", "}}"),
+        ),
+    )
+    for entry in DEMO_UPDATE_MESSAGES
+]
+
+# Timestamp format shown under each message title
+TIMESTAMP_FORMAT = "%d.%m.%y, %H:%M"
+
 
 class DemoUpdateMessagesService:
     """Service for sending demo update messages to the update channel."""
@@ -131,12 +158,20 @@ class DemoUpdateMessagesService:
         self.bot = bot
         self.running = False
         self.task: Optional[asyncio.Task] = None
-        self.messages_sent_this_hour = 0
         self.current_hour = -1
+        # Sorted send offsets for the current hour and the index of the next one
+        self._schedule: List[float] = []
+        self._schedule_idx = 0
+        # Shuffled template indices; each message is used once before any repeats
+        self._rng = random.Random()
+        self._order: List[int] = []
+        self._order_pos = 0
+        # Update channel, resolved once; None until the bot's channel cache has it
+        self._channel = None
 
     async def start(self) -> bool:
         """Start the Demo Update Messages Service."""
-        if not DEMO_MODE:
+        if not is_demo_mode():
             logger.info("Demo Update Messages Service not started - not in demo mode")
             return False
 
@@ -144,9 +179,15 @@ class DemoUpdateMessagesService:
             logger.warning("Demo Update Messages Service is already running")
             return False
 
+        self._channel = self.bot.get_channel(UPDATE_CHANNEL_ID)
+        if self._channel is None:
+            logger.info("Update channel %s not cached yet - resolving on first send",
+                        UPDATE_CHANNEL_ID)
+
         self.running = True
         self.task = asyncio.create_task(self._run_service())
-        logger.info("Demo Update Messages Service started - will send 12 messages per hour")
+        logger.info("Demo Update Messages Service started - will send %d messages per hour",
+                    MESSAGES_PER_HOUR)
         return True
 
     async def stop(self) -> bool:
@@ -164,90 +205,109 @@ class DemoUpdateMessagesService:
         logger.info("Demo Update Messages Service stopped")
         return True
 
+    def _plan_hour(self, seconds_into_hour: float) -> None:
+        """Draw this hour's send times as sorted offsets (seconds) from the top of the hour."""
+        self._schedule = sorted(
+            self._rng.uniform(seconds_into_hour, SECONDS_PER_HOUR) for _ in range(MESSAGES_PER_HOUR)
+        )
+        self._schedule_idx = 0
+        # Start every hour on a fresh shuffle
+        self._order = []
+
+    def _next_template(self) -> Tuple[str, str]:
+        """Return the next (container, template) in shuffled order, reshuffling when used up."""
+        if self._order_pos >= len(self._order):
+            self._order = list(range(len(DEMO_UPDATE_TEMPLATES)))
+            self._rng.shuffle(self._order)
+            self._order_pos = 0
+        template = DEMO_UPDATE_TEMPLATES[self._order[self._order_pos]]
+        self._order_pos += 1
+        return template
+
     async def _run_service(self):
-        """Main service loop - sends messages throughout each hour."""
+        """Main service loop - sends messages at the times planned for each hour."""
         logger.info("Demo Update Messages Service loop started")
 
         while self.running:
             try:
                 now = datetime.now()
-                current_hour = now.hour
-
-                # Reset counter at the start of each hour
-                if current_hour != self.current_hour:
-                    self.current_hour = current_hour
-                    self.messages_sent_this_hour = 0
-                    logger.info(f"New hour started ({current_hour}:00) - resetting message counter")
-
-                # Check if we still have messages to send this hour
-                if self.messages_sent_this_hour < 12:
-                    # Calculate remaining time in this hour
-                    minutes_remaining = 60 - now.minute
-                    messages_remaining = 12 - self.messages_sent_this_hour
-
-                    if messages_remaining > 0 and minutes_remaining > 0:
-                        # Calculate average interval, but cap at 10 minutes max
-                        avg_interval = min(10, minutes_remaining / messages_remaining)
-
-                        # Add some randomness (50% to 150% of average)
-                        wait_minutes = avg_interval * random.uniform(0.5, 1.5)
-                        wait_minutes = min(wait_minutes, 10)  # Cap at 10 minutes
-                        wait_minutes = max(wait_minutes, 0.5)  # Minimum 30 seconds
-
-                        wait_seconds = wait_minutes * 60
-
-                        logger.debug(f"Waiting {wait_minutes:.1f} minutes before next message")
-                        await asyncio.sleep(wait_seconds)
-
-                        # Send a random message
-                        if self.running:
-                            await self._send_random_message()
-                    else:
-                        # Wait until next hour
-                        await asyncio.sleep(60)
+                seconds_into_hour = now.minute * 60 + now.second + now.microsecond / 1_000_000
+
+                # Plan a fresh schedule at the start of each hour
+                if now.hour != self.current_hour:
+                    self.current_hour = now.hour
+                    self._plan_hour(seconds_into_hour)
+                    logger.info("New hour started (%d:00) - planned %d messages",
+                                now.hour, len(self._schedule))
+
+                if self._schedule_idx < len(self._schedule):
+                    wait_seconds = self._schedule[self._schedule_idx] - seconds_into_hour
+                    logger.debug("Waiting %.1f minutes before next message", wait_seconds / 60)
+                    await asyncio.sleep(max(0.0, wait_seconds))
+
+                    if self.running:
+                        # Slots that came due while we slept are sent together in one request
+                        now = datetime.now()
+                        seconds_into_hour = (now.minute * 60 + now.second
+                                             + now.microsecond / 1_000_000)
+                        due = bisect.bisect_right(self._schedule, seconds_into_hour,
+                                                  lo=self._schedule_idx)
+                        count = max(1, due - self._schedule_idx)
+                        self._schedule_idx += count
+                        await self._send_random_message(count)
                 else:
-                    # All messages sent this hour, wait for next hour
-                    await asyncio.sleep(60)
+                    # All messages sent this hour, wait for the next one
+                    await asyncio.sleep(SECONDS_PER_HOUR - seconds_into_hour)
 
             except asyncio.CancelledError:
                 logger.info("Demo Update Messages Service cancelled")
                 break
             except Exception as e:
-                logger.error(f"Error in Demo Update Messages Service loop: {e}", exc_info=True)
+                logger.error("Error in Demo Update Messages Service loop: %s", e, exc_info=True)
                 await asyncio.sleep(60)
 
-    async def _send_random_message(self):
-        """Send a random demo update message to the update channel."""
-        try:
-            channel = self.bot.get_channel(UPDATE_CHANNEL_ID)
-            if not channel:
-                logger.warning(f"Update channel {UPDATE_CHANNEL_ID} not found")
-                return
-
-            # Pick a random message
-            message_data = random.choice(DEMO_UPDATE_MESSAGES)
-
-            # Format the message
-            now = datetime.now()
-            timestamp = now.strftime("%d.%m.%y, %H:%M")
+    async def _send_random_message(self, count: int = 1):
+        """Send random demo update messages to the update channel.
 
-            full_message = f"**{message_data['title']}**\n"
-            full_message += f"— {timestamp}\n\n"
-            full_message += message_data['content']
-            full_message += DISCLAIMER
-
-            # Send the message
-            await channel.send(full_message)
+        More than one message is packed into as few Discord messages as the
+        length limit allows.
+        """
+        try:
+            if self._channel is None:
+                # The channel cache may not have been ready at start(); look it up again
+                self._channel = self.bot.get_channel(UPDATE_CHANNEL_ID)
+                if self._channel is None:
+                    logger.warning("Update channel %s not found - skipping demo update message",
+                                   UPDATE_CHANNEL_ID)
+                    return
+
+            # Take the next pre-rendered messages and fill in the timestamp
+            timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+            picked = [self._next_template() for _ in range(count)]
+
+            batch = ""
+            for _, template in picked:
+                rendered = template.format(ts=timestamp)
+                batched_len = len(batch) + len(MESSAGE_SEPARATOR) + len(rendered)
+                if batch and batched_len > DISCORD_MESSAGE_LIMIT:
+                    await self._channel.send(batch)
+                    batch = rendered
+                else:
+                    batch = f"{batch}{MESSAGE_SEPARATOR}{rendered}" if batch else rendered
+            await self._channel.send(batch)
 
-            self.messages_sent_this_hour += 1
-            logger.info(f"Sent demo update message #{self.messages_sent_this_hour}/12: {message_data['container']}")
+            containers = ", ".join(container for container, _ in picked)
+            logger.info("Sent demo update message #%d/%d: %s",
+                        self._schedule_idx, MESSAGES_PER_HOUR, containers)
 
         except Exception as e:
-            logger.error(f"Failed to send demo update message: {e}", exc_info=True)
+            # Drop the cached channel so a deleted or inaccessible channel is resolved again
+            self._channel = None
+            logger.error("Failed to send demo update message: %s", e, exc_info=True)
 
     async def send_test_message(self) -> bool:
         """Send a single test message (for manual testing)."""
-        if not DEMO_MODE:
+        if not is_demo_mode():
             logger.warning("Test message rejected - not in demo mode")
             return False
 
@@ -13,14 +13,212 @@ for various log types including container logs, bot logs, Discord logs, and acti
 """
 
 import os
-import logging
+import io
 import asyncio
-from typing import Dict, Any, Optional, List
+import logging
+import mmap
+import re
+import stat
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import docker
+    import docker.errors
+except ImportError:
+    docker = None  # Handle missing docker library gracefully
+
 logger = logging.getLogger(__name__)
 
+# Docker exception classes resolved once; only consulted when docker is installed
+_docker_errors = getattr(docker, 'errors', None)
+_DockerNotFound = getattr(_docker_errors, 'NotFound', Exception)
+_DockerAPIError = getattr(_docker_errors, 'APIError', Exception)
+_DockerException = getattr(_docker_errors, 'DockerException', Exception)
+
+# Block size for reading log files backwards from the end
+_TAIL_CHUNK_SIZE = 64 * 1024
+
+# Files larger than this are tailed through mmap so only the last pages are touched
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Docker API timeout for log requests, and how often a transient failure is retried
+_DOCKER_TIMEOUT = 10
+_DOCKER_RETRIES = 1
+
+# How long the shared Docker client is trusted before it is pinged again
+_CLIENT_PING_TTL = 60.0
+
+# Default cap on how many bytes of Docker log output are held for one response
+_LOG_MAX_BYTES = 4 * 1024 * 1024
+# First line of a Docker log tail whose older output was dropped to stay within the cap
+_TRUNCATION_MARKER = '[... older log output truncated: size limit reached ...]'
+# Bytes that can only continue a UTF-8 sequence, never start one
+_UTF8_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
+# How long a resolved log file path is trusted before probing the candidates again
+_PATH_TTL = 30.0
+
+# How long a successful log result is served again to repeated identical requests
+_RESULT_TTL = 2.0
+# Expired results are pruned once the cache holds more entries than this
+_RESULT_CACHE_SIZE = 64
+
+# The Docker fallback of a filtered read doubles its fetch up to this multiple of max_lines
+_FILTER_FETCH_GROWTH = 32
+
+# Upper bound on how much of a log file a filtered read scans backwards
+_FILTER_SCAN_LIMIT = 16 * 1024 * 1024
+
+# Fallback container name check when utils.common_helpers is unavailable
+_VALID_CONTAINER_NAME = re.compile(r'[a-zA-Z0-9_.-]+').fullmatch
+
+# Case-insensitive substrings used to pick log lines out of the container logs
+_BOT_FILTERS = ('bot.py', 'cog', 'discord.py', 'discord bot', 'command', 'slash', 'cache',
+                'container', 'update')
+_DISCORD_FILTERS = ('discord', 'guild', 'channel', 'member', 'message', 'voice', 'websocket')
+_WEBUI_FILTERS = ('flask', 'Flask', 'gunicorn', 'Gunicorn', 'GET /', 'POST /', 'HTTP',
+                  '127.0.0.1', '0.0.0.0:5000', 'werkzeug', 'jinja2')
+_APPLICATION_FILTERS = ('ERROR', 'WARNING', 'INFO', 'DEBUG', 'Starting', 'Stopping',
+                        'Initializing', 'Config', 'Database', 'Scheduler')
+
+
+def _tail_filter_file(path: str, max_lines: int, pattern: "re.Pattern[bytes]") -> List[str]:
+    """Return the last max_lines lines of path matching pattern, oldest first.
+
+    The file is read backwards in _TAIL_CHUNK_SIZE blocks and the scan stops as
+    soon as max_lines matches are collected or _FILTER_SCAN_LIMIT bytes were read.
+    pattern is matched against the raw bytes; only matching lines are decoded.
+    """
+    found: List[str] = []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        offset = os.fstat(fd).st_size
+        scanned = 0
+        carry = b''
+        while offset > 0 and len(found) < max_lines and scanned < _FILTER_SCAN_LIMIT:
+            read_size = min(_TAIL_CHUNK_SIZE, offset)
+            offset -= read_size
+            scanned += read_size
+            lines = (os.pread(fd, read_size, offset) + carry).split(b'\n')
+            # The first piece may continue in the previous block, unless we reached the start
+            carry = lines[0] if offset > 0 else b''
+            for raw in reversed(lines[1:] if offset > 0 else lines):
+                if pattern.search(raw):
+                    found.append(raw.decode('utf-8', errors='replace'))
+                    if len(found) >= max_lines:
+                        break
+    finally:
+        os.close(fd)
+    found.reverse()
+    return found
+
+
+@lru_cache(maxsize=16)
+def _compile_filters(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile literal filter substrings into one case-insensitive alternation."""
+    return re.compile('|'.join(map(re.escape, patterns)), re.IGNORECASE)
+
+
+@lru_cache(maxsize=16)
+def _compile_byte_filters(patterns: Tuple[str, ...]) -> "re.Pattern[bytes]":
+    """Bytes variant of _compile_filters for matching undecoded log data."""
+    return re.compile(b'|'.join(re.escape(p.encode('utf-8')) for p in patterns), re.IGNORECASE)
+
+
+def _read_tail(fd: int, size: int, max_lines: int) -> bytes:
+    """Return the trailing bytes of fd that hold at least its last max_lines lines.
+
+    Reads backwards from size with pread until max_lines + 1 newlines have been
+    seen (so the first returned line is complete) or the start of the file is
+    reached. A non-positive max_lines returns the whole file.
+    """
+    chunks = []
+    offset = size
+    newlines = 0
+    while offset > 0 and (max_lines <= 0 or newlines <= max_lines):
+        read_size = min(_TAIL_CHUNK_SIZE, offset)
+        offset -= read_size
+        chunk = os.pread(fd, read_size, offset)
+        chunks.append(chunk)
+        newlines += chunk.count(b'\n')
+    return b''.join(reversed(chunks))
+
+
+def _tail_stream(chunks, max_lines: int, max_bytes: int) -> str:
+    """Keep the newest max_lines lines of a byte stream, holding at most max_bytes of them.
+
+    The whole stream is read. Past the byte budget the oldest lines are evicted
+    (a single oversized line keeps only its end) and the result is prefixed
+    with _TRUNCATION_MARKER, so the view still ends at the newest output.
+    """
+    lines = deque()
+    held = 0
+    truncated = False
+    partial = b''
+    max_lines = max(max_lines, 0)
+
+    def _clip(line: bytes) -> bytes:
+        nonlocal truncated
+        if len(line) <= max_bytes:
+            return line
+        truncated = True
+        # Drop UTF-8 continuation bytes left over from a character cut in half
+        return line[len(line) - max_bytes:].lstrip(_UTF8_CONTINUATION_BYTES)
+
+    def _keep(line: bytes) -> None:
+        nonlocal held, truncated
+        line = _clip(line)
+        lines.append(line)
+        held += len(line)
+        while len(lines) > max_lines:
+            held -= len(lines.popleft())
+        while held > max_bytes:
+            held -= len(lines.popleft())
+            truncated = True
+
+    for chunk in chunks:
+        # Multi-byte UTF-8 sequences never contain b'\n', so raw splitting is safe
+        # and lines are only decoded once they are known to be kept
+        parts = (partial + chunk).split(b'\n')
+        partial = _clip(parts.pop())
+        for line in parts:
+            _keep(line)
+    if partial:
+        _keep(partial)
+
+    text = b'\n'.join(lines).decode('utf-8', errors='replace')
+    return f"{_TRUNCATION_MARKER}\n{text}" if truncated else text
+
+
+def _mmap_tail(fd: int, max_lines: int) -> Optional[bytes]:
+    """Return the last max_lines lines of fd by scanning a read-only mapping backwards.
+
+    Returns None where mmap.madvise is unavailable so the caller can use the
+    pread path instead.
+    """
+    if not hasattr(mmap, 'MADV_RANDOM'):
+        return None
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        # Only the tail is read; stop the kernel from reading ahead
+        mm.madvise(mmap.MADV_RANDOM)
+        end = len(mm)
+        pos = end
+        if max_lines <= 0:
+            pos = -1
+        else:
+            for _ in range(max_lines + 1):
+                pos = mm.rfind(b'\n', 0, pos)
+                if pos < 0:
+                    break
+        return mm[pos + 1:end]
+
 
 class LogType(Enum):
     """Enumeration of supported log types."""
@@ -37,6 +235,7 @@ class ContainerLogRequest:
     """Represents a container log retrieval request."""
     container_name: str
     max_lines: int = 500
+    max_bytes: int = _LOG_MAX_BYTES
 
 
 @dataclass
@@ -69,6 +268,20 @@ class LogResult:
     status_code: int = 200
 
 
+# clear_logs responses for every known log type, built once; unknown types get the container one
+_CLEAR_RESPONSES = {
+    log_type.value: LogResult(
+        success=True,
+        data={
+            'success': True,
+            'message': f'{log_type.value.capitalize()} logs cleared '
+                       '(Note: Docker container logs persist until container restart)'
+        }
+    )
+    for log_type in LogType
+}
+
+
 class ContainerLogService:
     """Service for comprehensive container and application log management."""
 
@@ -86,6 +299,29 @@ class ContainerLogService:
             # Combined container logs - supervisord captures all process output
             'container': ['/app/logs/supervisord.log', '/var/log/supervisor/supervisord.log']
         }
+        # log_type -> candidates whose directory existed when last checked
+        self._viable_paths = self._find_viable_paths(self.log_paths)
+        # log_type -> (first existing path or None, monotonic expiry)
+        self._path_cache: Dict[str, Tuple[Optional[str], float]] = {}
+        # Shared Docker client, reused across requests and re-checked every _CLIENT_PING_TTL
+        self._docker_client = None
+        self._docker_client_checked = 0.0
+        self._docker_client_lock = threading.Lock()
+        # request key -> (successful LogResult, monotonic expiry), see _RESULT_TTL
+        self._result_cache: Dict[tuple, Tuple[LogResult, float]] = {}
+        # Guards every read and write of _result_cache; taken after _in_flight_lock, never before
+        self._result_cache_lock = threading.Lock()
+        # request key -> Future of the load in progress, shared by concurrent identical requests
+        self._in_flight: Dict[tuple, Future] = {}
+        self._in_flight_lock = threading.Lock()
+        self._external_validator = self._resolve_name_validator()
+        # LogType -> handler taking max_lines, used by get_filtered_logs
+        self._filtered_dispatch = {
+            LogType.BOT: self._get_bot_logs,
+            LogType.DISCORD: self._get_discord_logs,
+            LogType.WEBUI: self._get_webui_logs,
+            LogType.APPLICATION: self._get_application_logs,
+        }
 
     def get_container_logs(self, request: ContainerLogRequest) -> LogResult:
         """
@@ -97,6 +333,20 @@ class ContainerLogService:
         Returns:
             LogResult with log content or error information
         """
+        key = ('container', request.container_name, request.max_lines, request.max_bytes)
+        return self._cached_or_load(key, self._load_container_logs, request)
+
+    async def aget_container_logs(self, request: ContainerLogRequest) -> LogResult:
+        """
+        Async variant of get_container_logs for use from event-loop code.
+
+        The whole lookup (file reads and Docker fallback) runs in one worker
+        thread so the event loop is never blocked on disk or socket I/O.
+        """
+        return await asyncio.to_thread(self.get_container_logs, request)
+
+    def _load_container_logs(self, request: ContainerLogRequest) -> LogResult:
+        """Retrieve container logs, bypassing the result cache."""
         try:
             # Step 1: Validate container name
             if not self._validate_container_name(request.container_name):
@@ -109,50 +359,26 @@ class ContainerLogService:
             # Step 2: Try file-based logs first (faster and works without Docker API)
             # This is especially useful for own container logs
             if request.container_name == self.default_container:
-                for log_path in self.log_paths.get('container', []):
-                    if os.path.exists(log_path):
-                        file_content = self._read_log_file(log_path, request.max_lines)
-                        if file_content and file_content.strip():
-                            self.logger.info(f"Successfully read container logs from file: {log_path}")
-                            return LogResult(success=True, content=file_content)
-
-            # Step 3: Fall back to Docker API for logs - use simple sync method first
-            logs_content = self._get_container_logs_sync(request.container_name, request.max_lines)
+                log_path, file_content = self._read_log_type('container', request.max_lines)
+                if file_content:
+                    self.logger.info(f"Successfully read container logs from file: {log_path}")
+                    return LogResult(success=True, content=file_content)
 
-            # If sync method fails, try async as last resort
-            if logs_content is None:
-                try:
-                    # Check if we're in an async context
-                    loop = asyncio.get_running_loop()
-                    # We're in an async context but this method is sync
-                    # Use run_in_executor to run the async function
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        logs_content = executor.submit(
-                            lambda: asyncio.run(self._get_container_logs_service_first(
-                                request.container_name,
-                                request.max_lines
-                            ))
-                        ).result()
-                except RuntimeError:
-                    # No event loop running (gevent thread), use asyncio.run() directly
-                    try:
-                        logs_content = asyncio.run(self._get_container_logs_service_first(
-                            request.container_name,
-                            request.max_lines
-                        ))
-                    except Exception as e:
-                        self.logger.warning(f"Async Docker logs also failed: {e}")
+            # Step 3: Fall back to the Docker API (transient errors are retried once)
+            logs_content = self._get_container_logs_sync(
+                request.container_name, request.max_lines, request.max_bytes
+            )
 
             if logs_content is None:
                 # Last resort: try to read any available log file
-                for log_type, paths in self.log_paths.items():
-                    for log_path in paths:
-                        if os.path.exists(log_path):
-                            file_content = self._read_log_file(log_path, request.max_lines)
-                            if file_content and file_content.strip():
-                                self.logger.info(f"Fallback: read logs from {log_path}")
-                                return LogResult(success=True, content=f"[Reading from {log_type} log file]\n\n{file_content}")
+                for log_type in self.log_paths:
+                    log_path, file_content = self._read_log_type(log_type, request.max_lines)
+                    if file_content:
+                        self.logger.info(f"Fallback: read logs from {log_path}")
+                        return LogResult(
+                            success=True,
+                            content=f"[Reading from {log_type} log file]\n\n{file_content}"
+                        )
 
                 return LogResult(
                     success=False,
@@ -166,16 +392,18 @@ class ContainerLogService:
             )
 
         except (ImportError, AttributeError, TypeError, ValueError, RuntimeError) as e:
-            # Service/async errors (missing services, invalid types, runtime/event loop errors)
+            # Service errors (missing services, invalid types, runtime errors)
             self.logger.error(f"Service error retrieving container logs for {request.container_name}: {e}", exc_info=True)
 
             # Try file fallback even on error
-            for log_type, paths in self.log_paths.items():
-                for log_path in paths:
-                    if os.path.exists(log_path):
-                        file_content = self._read_log_file(log_path, request.max_lines)
-                        if file_content and file_content.strip():
-                            return LogResult(success=True, content=f"[Reading from {log_type} log file - Docker API unavailable]\n\n{file_content}")
+            for log_type in self.log_paths:
+                _, file_content = self._read_log_type(log_type, request.max_lines)
+                if file_content:
+                    return LogResult(
+                        success=True,
+                        content=(f"[Reading from {log_type} log file - Docker API unavailable]"
+                                 f"\n\n{file_content}")
+                    )
 
             return LogResult(
                 success=False,
@@ -193,21 +421,20 @@ class ContainerLogService:
         Returns:
             LogResult with filtered log content or error information
         """
+        key = ('filtered', request.log_type, request.max_lines)
+        return self._cached_or_load(key, self._load_filtered_logs, request)
+
+    def _load_filtered_logs(self, request: FilteredLogRequest) -> LogResult:
+        """Retrieve filtered logs, bypassing the result cache."""
         try:
-            if request.log_type == LogType.BOT:
-                return self._get_bot_logs(request.max_lines)
-            elif request.log_type == LogType.DISCORD:
-                return self._get_discord_logs(request.max_lines)
-            elif request.log_type == LogType.WEBUI:
-                return self._get_webui_logs(request.max_lines)
-            elif request.log_type == LogType.APPLICATION:
-                return self._get_application_logs(request.max_lines)
-            else:
+            handler = self._filtered_dispatch.get(request.log_type)
+            if handler is None:
                 return LogResult(
                     success=False,
                     error=f"Unsupported log type: {request.log_type}",
                     status_code=400
                 )
+            return handler(request.max_lines)
 
         except (AttributeError, TypeError, ValueError, RuntimeError) as e:
             # Data/service errors (invalid enum, type errors, runtime errors)
@@ -255,16 +482,12 @@ class ContainerLogService:
         """
         try:
             self.logger.info(f"Clear logs request for type: {request.log_type}")
+            with self._result_cache_lock:
+                self._result_cache.clear()
 
             # Note: Docker container logs cannot be cleared directly
             # This is prepared for future file-based logging implementation
-            return LogResult(
-                success=True,
-                data={
-                    'success': True,
-                    'message': f'{request.log_type.capitalize()} logs cleared (Note: Docker container logs persist until container restart)'
-                }
-            )
+            return _CLEAR_RESPONSES.get(request.log_type, _CLEAR_RESPONSES[LogType.CONTAINER.value])
 
         except (AttributeError, TypeError, ValueError) as e:
             # Data/operation errors (invalid attributes, type errors, value errors)
@@ -279,206 +502,354 @@ class ContainerLogService:
     # Private Helper Methods
     # ========================================================================
 
-    def _validate_container_name(self, container_name: str) -> bool:
-        """Validate container name to prevent injection attacks."""
-        try:
-            from utils.common_helpers import validate_container_name
-            return validate_container_name(container_name)
-        except ImportError:
-            # Fallback validation if utility is not available
-            import re
-            return bool(re.match(r'^[a-zA-Z0-9_.-]+$', container_name))
+    def _cached_or_load(self, key: tuple, load, request) -> LogResult:
+        """Return the cached result for key, or load it once for all concurrent callers.
 
-    def _get_container_logs_sync(self, container_name: str, max_lines: int) -> Optional[str]:
-        """Simple synchronous Docker log retrieval - more reliable with gevent."""
-        try:
-            import docker
-            client = docker.from_env()
-            container = client.containers.get(container_name)
-            logs = container.logs(tail=max_lines, stdout=True, stderr=True)
-            return logs.decode('utf-8', errors='replace')
-        except docker.errors.NotFound:
-            self.logger.warning(f"Container not found: {container_name}")
-            return None
-        except docker.errors.APIError as e:
-            self.logger.error(f"Docker API error: {e}")
-            return None
-        except Exception as e:
-            self.logger.error(f"Error getting Docker logs sync: {e}", exc_info=True)
-            return None
+        The first caller to miss runs load(request); identical requests that
+        arrive meanwhile wait for its result instead of starting their own.
+        """
+        result = self._cached_result(key)
+        if result is not None:
+            return result
+
+        with self._in_flight_lock:
+            result = self._cached_result(key)
+            if result is not None:
+                return result
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+
+        if not owner:
+            return future.result()
 
-    async def _get_docker_client_async(self):
-        """Get Docker client with SERVICE FIRST pattern."""
         try:
-            # SERVICE FIRST: Use Docker Client Service
-            from services.docker_service.docker_client_pool import get_docker_client_async
-            return get_docker_client_async(operation='logs', timeout=30.0)
-        except (ImportError, AttributeError, TypeError, RuntimeError) as e:
-            # Service/import errors (missing docker service, attribute errors, runtime errors)
-            self.logger.error(f"Failed to get Docker client: {e}", exc_info=True)
+            result = load(request)
+            # Cache before the flight ends so later callers never miss in between
+            self._remember_result(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(key, None)
+
+    def _cached_result(self, key: tuple) -> Optional[LogResult]:
+        """Return the cached result for key if it has not expired yet."""
+        with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    def _remember_result(self, key: tuple, result: LogResult) -> None:
+        """Cache a successful result for _RESULT_TTL seconds."""
+        if not result.success:
+            return
+        now = time.monotonic()
+        with self._result_cache_lock:
+            cache = self._result_cache
+            if len(cache) >= _RESULT_CACHE_SIZE:
+                for stale in [k for k, (_, expiry) in cache.items() if expiry <= now]:
+                    del cache[stale]
+                if len(cache) >= _RESULT_CACHE_SIZE:
+                    cache.clear()
+            cache[key] = (result, now + _RESULT_TTL)
+
+    @staticmethod
+    def _resolve_name_validator():
+        """Return utils.common_helpers.validate_container_name, or None if unavailable."""
+        try:
+            from utils.common_helpers import validate_container_name
+            return validate_container_name
+        except ImportError:
             return None
 
-    async def _fetch_container_logs_async(self, client, container_name: str, max_lines: int) -> Optional[str]:
-        """Fetch logs from Docker container with error handling using SERVICE FIRST pattern."""
+    def _validate_container_name(self, container_name: str) -> bool:
+        """Validate container name to prevent injection attacks."""
+        if self._external_validator is not None:
+            return self._external_validator(container_name)
+        # Fallback validation if utility is not available
+        return isinstance(container_name, str) and _VALID_CONTAINER_NAME(container_name) is not None
+
+    def _get_docker_client(self):
+        """Return the shared Docker client, creating or replacing it as needed."""
+        with self._docker_client_lock:
+            now = time.monotonic()
+            client = self._docker_client
+            if client is not None and now - self._docker_client_checked >= _CLIENT_PING_TTL:
+                try:
+                    client.ping()
+                    self._docker_client_checked = now
+                except (_DockerException, OSError, RuntimeError) as e:
+                    self.logger.warning(f"Cached Docker client is stale, reconnecting: {e}")
+                    self._close_docker_client(client)
+                    client = None
+
+            if client is None:
+                client = docker.from_env(timeout=_DOCKER_TIMEOUT)
+                self._docker_client = client
+                self._docker_client_checked = now
+            return client
+
+    def _discard_docker_client(self, client) -> None:
+        """Drop client from the cache (if it is still cached) after a failed request."""
+        with self._docker_client_lock:
+            if self._docker_client is client:
+                self._close_docker_client(client)
+
+    def _close_docker_client(self, client) -> None:
+        """Close client and forget it; the caller holds _docker_client_lock."""
+        self._docker_client = None
         try:
-            import docker
-            import asyncio
-
-            # Use async thread execution for Docker API calls
-            container = await asyncio.to_thread(client.containers.get, container_name)
-            logs = await asyncio.to_thread(
-                lambda: container.logs(tail=max_lines, stdout=True, stderr=True)
-            )
-            return logs.decode('utf-8', errors='replace')
-
-        except docker.errors.NotFound:
-            self.logger.warning(f"Log request for non-existent container: {container_name}")
+            client.close()
+        except (OSError, RuntimeError, AttributeError) as e:
+            # Client close errors are non-critical - just log
+            self.logger.debug(f"Error closing Docker client: {e}")
+
+    def _get_container_logs_sync(self, container_name: str, max_lines: int,
+                                 max_bytes: int = _LOG_MAX_BYTES) -> Optional[str]:
+        """Simple synchronous Docker log retrieval - more reliable with gevent.
+
+        The logs are streamed and at most max_bytes of the newest lines are held,
+        so memory stays bounded.
+        API errors are treated as transient and retried _DOCKER_RETRIES times;
+        a missing container is not.
+        """
+        if docker is None:
+            self.logger.error("Docker SDK not available")
             return None
-        except docker.errors.APIError as e:
-            self.logger.error(f"Docker API error when fetching logs for {container_name}: {e}")
-            raise RuntimeError("Could not retrieve logs due to a Docker API error")
-        except (ImportError, AttributeError, TypeError, UnicodeDecodeError, RuntimeError) as e:
-            # Import/decode/async errors (missing modules, attribute errors, decode errors, runtime errors)
-            self.logger.error(f"Error fetching container logs: {e}", exc_info=True)
-            raise
 
-    async def _get_container_logs_service_first(self, container_name: str, max_lines: int) -> Optional[str]:
-        """Get container logs using SERVICE FIRST Docker Client Service."""
-        try:
-            # Get Docker client using SERVICE FIRST pattern
-            client_context = await self._get_docker_client_async()
-            if not client_context:
+        for attempt in range(_DOCKER_RETRIES + 1):
+            client = None
+            try:
+                client = self._get_docker_client()
+                container = client.containers.get(container_name)
+                # follow defaults to stream in docker-py; only the existing tail is wanted
+                stream = container.logs(stream=True, follow=False, tail=max_lines,
+                                        stdout=True, stderr=True)
+                try:
+                    return _tail_stream(stream, max_lines, max_bytes)
+                finally:
+                    # Releases the connection even when reading the stream failed
+                    stream.close()
+            except _DockerNotFound:
+                self.logger.warning(f"Container not found: {container_name}")
                 return None
-
-            # Use the context manager for proper cleanup
-            async with client_context as client:
-                return await self._fetch_container_logs_async(client, container_name, max_lines)
-
-        except (AttributeError, TypeError, RuntimeError) as e:
-            # Async/context errors (missing attributes, type errors, runtime errors)
-            self.logger.error(f"Error in SERVICE FIRST container logs: {e}", exc_info=True)
-            return None
+            except _DockerAPIError as e:
+                self.logger.error(f"Docker API error (attempt {attempt + 1}): {e}")
+            except Exception as e:
+                self.logger.error(f"Error getting Docker logs sync (attempt {attempt + 1}): {e}",
+                                  exc_info=True)
+                # Likely a broken connection: the retry starts from a fresh client
+                if client is not None:
+                    self._discard_docker_client(client)
+        return None
 
     def _get_bot_logs(self, max_lines: int) -> LogResult:
         """Get bot-specific logs with file fallback."""
         # Try reading from bot.log file first (multiple possible paths)
-        for bot_log_path in self.log_paths['bot']:
-            if os.path.exists(bot_log_path):
-                file_content = self._read_log_file(bot_log_path, max_lines)
-                if file_content and file_content.strip():
-                    self.logger.info(f"Successfully read bot logs from: {bot_log_path}")
-                    return LogResult(success=True, content=file_content)
+        log_path, file_content = self._read_log_type('bot', max_lines)
+        if file_content:
+            self.logger.info(f"Successfully read bot logs from: {log_path}")
+            return LogResult(success=True, content=file_content)
 
         # Fallback: Get from container logs and filter
         self.logger.info("Bot log files not found, falling back to container log filtering")
         return self._get_filtered_container_logs(
             max_lines,
-            ['bot.py', 'cog', 'discord.py', 'discord bot', 'command', 'slash', 'cache', 'container', 'update'],
+            _BOT_FILTERS,
             "No bot logs found"
         )
 
     def _get_discord_logs(self, max_lines: int) -> LogResult:
         """Get Discord-specific logs with file fallback."""
         # Try reading from discord.log file first (multiple possible paths)
-        for discord_log_path in self.log_paths['discord']:
-            if os.path.exists(discord_log_path):
-                file_content = self._read_log_file(discord_log_path, max_lines)
-                if file_content and file_content.strip():
-                    self.logger.info(f"Successfully read Discord logs from: {discord_log_path}")
-                    return LogResult(success=True, content=file_content)
+        log_path, file_content = self._read_log_type('discord', max_lines)
+        if file_content:
+            self.logger.info(f"Successfully read Discord logs from: {log_path}")
+            return LogResult(success=True, content=file_content)
 
         # Fallback: Get from container logs and filter
         self.logger.info("Discord log files not found, falling back to container log filtering")
         return self._get_filtered_container_logs(
             max_lines,
-            ['discord', 'guild', 'channel', 'member', 'message', 'voice', 'websocket'],
+            _DISCORD_FILTERS,
             "No Discord logs found"
         )
 
     def _get_webui_logs(self, max_lines: int) -> LogResult:
         """Get Web UI specific logs with file fallback."""
         # Try reading from webui_error.log file first (multiple possible paths)
-        for webui_log_path in self.log_paths['webui']:
-            if os.path.exists(webui_log_path):
-                file_content = self._read_log_file(webui_log_path, max_lines)
-                if file_content and file_content.strip():
-                    self.logger.info(f"Successfully read Web UI logs from: {webui_log_path}")
-                    return LogResult(success=True, content=file_content)
+        log_path, file_content = self._read_log_type('webui', max_lines)
+        if file_content:
+            self.logger.info(f"Successfully read Web UI logs from: {log_path}")
+            return LogResult(success=True, content=file_content)
 
         # Fallback: Get from container logs and filter
         self.logger.info("Web UI log files not found, falling back to container log filtering")
         return self._get_filtered_container_logs(
             max_lines,
-            ['flask', 'Flask', 'gunicorn', 'Gunicorn', 'GET /', 'POST /', 'HTTP', '127.0.0.1', '0.0.0.0:5000', 'werkzeug', 'jinja2'],
+            _WEBUI_FILTERS,
             "No Web UI logs found"
         )
 
     def _get_application_logs(self, max_lines: int) -> LogResult:
         """Get application-level logs with file fallback."""
         # Try reading from supervisord.log file first (multiple possible paths)
-        for app_log_path in self.log_paths['application']:
-            if os.path.exists(app_log_path):
-                file_content = self._read_log_file(app_log_path, max_lines)
-                if file_content and file_content.strip():
-                    self.logger.info(f"Successfully read application logs from: {app_log_path}")
-                    return LogResult(success=True, content=file_content)
+        log_path, file_content = self._read_log_type('application', max_lines)
+        if file_content:
+            self.logger.info(f"Successfully read application logs from: {log_path}")
+            return LogResult(success=True, content=file_content)
 
         # Fallback: Get from container logs and filter
         self.logger.info("Application log files not found, falling back to container log filtering")
         return self._get_filtered_container_logs(
             max_lines,
-            ['ERROR', 'WARNING', 'INFO', 'DEBUG', 'Starting', 'Stopping', 'Initializing', 'Config', 'Database', 'Scheduler'],
+            _APPLICATION_FILTERS,
             "No application logs found"
         )
 
-    def _get_filtered_container_logs(self, max_lines: int, filter_patterns: List[str], no_logs_message: str) -> LogResult:
-        """Get filtered logs from default container."""
-        try:
-            # Use simple sync method first (more reliable with gevent)
-            logs_str = self._get_container_logs_sync(self.default_container, max_lines * 2)
+    def _get_filtered_container_logs(self, max_lines: int, filter_patterns: Tuple[str, ...],
+                                     no_logs_message: str) -> LogResult:
+        """Get filtered logs from default container.
 
-            # Fallback to async if sync fails
-            if logs_str is None:
+        Only the log file path matches on raw bytes (_compile_byte_filters). The
+        Docker fallback matches decoded lines: it needs the raw line count of each
+        fetch to tell whether the log ran out before doubling the next one.
+        """
+        try:
+            # Prefer the combined container log file: scan it backwards and stop at
+            # max_lines matches
+            log_path = self._resolve_path('container')
+            if log_path is not None:
                 try:
-                    loop = asyncio.get_running_loop()
-                    task = loop.create_task(self._get_container_logs_service_first(self.default_container, max_lines * 2))
-                    logs_str = asyncio.run_coroutine_threadsafe(task, loop).result()
-                except RuntimeError:
-                    try:
-                        logs_str = asyncio.run(self._get_container_logs_service_first(self.default_container, max_lines * 2))
-                    except Exception:
-                        pass
-
-            if logs_str is None:
-                return LogResult(success=True, content=no_logs_message)
-
-            # Filter logs based on patterns
-            filtered_lines = []
-            for line in logs_str.split('\n'):
-                if any(pattern in line.lower() for pattern in [p.lower() for p in filter_patterns]):
-                    filtered_lines.append(line)
-
-            # Limit to max_lines and format result
-            filtered_logs = '\n'.join(filtered_lines[-max_lines:]) if filtered_lines else no_logs_message
-
-            return LogResult(success=True, content=filtered_logs)
+                    filtered_lines = _tail_filter_file(
+                        log_path, max_lines, _compile_byte_filters(filter_patterns)
+                    )
+                except OSError as e:
+                    self.logger.warning(f"Could not filter container log file {log_path}: {e}")
+                    self._path_cache.pop('container', None)
+                else:
+                    content = '\n'.join(filtered_lines) if filtered_lines else no_logs_message
+                    return LogResult(success=True, content=content)
+
+            # No log file: ask the Docker API (transient errors are retried once).
+            # Start with max_lines and double until enough lines match or the log runs out.
+            matches = _compile_filters(filter_patterns).search
+            fetch_lines = max_lines
+            while True:
+                logs_str = self._get_container_logs_sync(self.default_container, fetch_lines)
+                if logs_str is None:
+                    return LogResult(success=True, content=no_logs_message)
+
+                # Filter logs based on patterns, keeping only the newest max_lines matches
+                lines = logs_str.split('\n')
+                filtered_lines = deque((line for line in lines if matches(line)), maxlen=max_lines)
+                if (len(filtered_lines) >= max_lines or len(lines) < fetch_lines
+                        or fetch_lines >= max_lines * _FILTER_FETCH_GROWTH):
+                    break
+                fetch_lines *= 2
+
+            return LogResult(success=True, content='\n'.join(filtered_lines) or no_logs_message)
 
         except (AttributeError, TypeError, RuntimeError, ValueError) as e:
-            # Async/data errors (attribute errors, type errors, runtime/async errors, value errors)
+            # Data errors (attribute errors, type errors, runtime errors, value errors)
             self.logger.error(f"Error getting filtered container logs: {e}", exc_info=True)
             return LogResult(success=True, content=no_logs_message)
 
+    def _resolve_path(self, log_type: str) -> Optional[str]:
+        """Return the first existing log file for log_type, re-probed at most every _PATH_TTL s."""
+        now = time.monotonic()
+        cached = self._path_cache.get(log_type)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        candidates = self._viable_paths.get(log_type)
+        if not candidates:
+            # None of the directories existed yet - they may have been created since
+            log_paths = {log_type: self.log_paths.get(log_type, [])}
+            candidates = self._find_viable_paths(log_paths)[log_type]
+            self._viable_paths[log_type] = candidates
+
+        path = next((p for p in candidates if os.path.exists(p)), None)
+        self._path_cache[log_type] = (path, now + _PATH_TTL)
+        return path
+
+    @staticmethod
+    def _find_viable_paths(log_paths: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Keep only candidates whose directory exists, checking each directory once."""
+        dir_exists: Dict[str, bool] = {}
+        viable = {}
+        for log_type, paths in log_paths.items():
+            viable[log_type] = []
+            for path in paths:
+                parent = os.path.dirname(path)
+                if parent not in dir_exists:
+                    dir_exists[parent] = os.path.isdir(parent)
+                if dir_exists[parent]:
+                    viable[log_type].append(path)
+        return viable
+
+    def _read_log_type(self, log_type: str, max_lines: int) -> Tuple[Optional[str], Optional[str]]:
+        """Read the log file for log_type; returns (path, content).
+
+        content is None if the file is empty or unreadable. The resolved path is
+        read first; if it is empty the later candidates are tried in order.
+        """
+        log_path = self._resolve_path(log_type)
+        if log_path is None:
+            return None, None
+
+        file_content = self._read_log_file(log_path, max_lines)
+        if file_content is None:
+            # File vanished or became unreadable - probe the candidates again next time
+            self._path_cache.pop(log_type, None)
+        elif file_content.strip():
+            return log_path, file_content
+
+        # Empty or just rotated: a later candidate may still hold the logs
+        candidates = self._viable_paths.get(log_type, [])
+        later = candidates[candidates.index(log_path) + 1:] if log_path in candidates else []
+        for path in later:
+            content = self._read_log_file(path, max_lines)
+            if content and content.strip():
+                return path, content
+        return log_path, None
+
     def _read_log_file(self, file_path: str, max_lines: int) -> Optional[str]:
-        """Read log file with line limiting."""
+        """Read the last max_lines lines of a log file without loading the whole file."""
         try:
-            if not os.path.exists(file_path):
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+            except FileNotFoundError:
                 return None
-
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                lines = f.readlines()
-                # Get last max_lines
-                recent_lines = lines[-max_lines:] if len(lines) > max_lines else lines
-                return ''.join(recent_lines)
+            keep = max_lines if max_lines > 0 else None
+            try:
+                st = os.fstat(fd)
+                if not stat.S_ISREG(st.st_mode):
+                    # Pipes and devices cannot be read from the end: stream them through
+                    with io.open(fd, 'r', encoding='utf-8', errors='replace', closefd=False) as f:
+                        return ''.join(deque(f, maxlen=keep))
+                data = None
+                if st.st_size > _MMAP_THRESHOLD:
+                    try:
+                        data = _mmap_tail(fd, max_lines)
+                    except ValueError:
+                        # The file shrank (e.g. truncated on rotation) after fstat; mmap
+                        # refuses an empty file, so re-stat and tail it with pread
+                        st = os.fstat(fd)
+                if data is None:
+                    data = _read_tail(fd, st.st_size, max_lines)
+            finally:
+                os.close(fd)
+
+            # Same line splitting as text-mode readlines() (universal newlines)
+            text = io.StringIO(data.decode('utf-8', errors='replace'), newline=None)
+            return ''.join(deque(text, maxlen=keep))
 
         except (IOError, OSError, PermissionError, UnicodeDecodeError) as e:
             # File I/O errors (read errors, permissions, decode errors)
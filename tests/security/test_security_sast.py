@@ -21,6 +21,17 @@ from unittest.mock import patch, Mock
 from tests.security.security_test_helpers import SecurityTestHelper
 
 
+@pytest.fixture(autouse=True)
+def _no_background_services(monkeypatch):
+    """Keep create_app() from spawning the Docker refresh and mech decay greenlets.
+
+    The refresh greenlet runs asyncio.run() on the main thread once it wakes up,
+    which clears the main thread's event loop under later async tests.
+    """
+    monkeypatch.setenv("DDC_ENABLE_BACKGROUND_REFRESH", "false")
+    monkeypatch.setenv("DDC_ENABLE_MECH_DECAY", "false")
+
+
 @pytest.mark.security
 class TestSASTSecurityScanning:
     """Static Application Security Testing using Bandit."""
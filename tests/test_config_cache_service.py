@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+import os
+
+from services.config import config_cache_service as cache_module
+from services.config.config_cache_service import ConfigCacheService, _clone_config
+
+
+def test_clone_config_detaches_nested_containers():
+    config = {"servers": [{"name": "ddc", "allowed_actions": ["status"]}], "lang": "en"}
+
+    clone = _clone_config(config)
+    clone["servers"][0]["allowed_actions"].append("restart")
+    clone["servers"].append({"name": "extra"})
+
+    assert config == {"servers": [{"name": "ddc", "allowed_actions": ["status"]}], "lang": "en"}
+
+
+def test_cached_config_is_a_snapshot_of_the_callers_dict(tmp_path):
+    cache = ConfigCacheService()
+    config = {"channel_permissions": {"123": {"commands": {"control": True}}}}
+
+    cache.set_cached_config("main", config, tmp_path)
+    config["channel_permissions"]["123"]["commands"]["control"] = False
+
+    cached = cache.get_cached_config("main", tmp_path)
+    assert cached == {"channel_permissions": {"123": {"commands": {"control": True}}}}
+
+
+def test_mutating_a_cache_hit_leaves_the_cache_unchanged(tmp_path):
+    cache = ConfigCacheService()
+    cache.set_cached_config("main", {"servers": [{"name": "ddc", "allowed_actions": ["status"]}]},
+                            tmp_path)
+
+    hit = cache.get_cached_config("main", tmp_path)
+    hit["servers"][0]["allowed_actions"].append("restart")
+    hit["servers"].append({"name": "extra"})
+
+    assert cache.get_cached_config("main", tmp_path) == {
+        "servers": [{"name": "ddc", "allowed_actions": ["status"]}]
+    }
+
+
+def test_construction_and_reads_do_not_create_timestamp_file(tmp_path):
+    cache = ConfigCacheService()
+    cache.set_cached_config("main", {"lang": "en"}, tmp_path)
+
+    # No invalidation yet, so the entry is served without the marker file
+    assert cache.get_cached_config("main", tmp_path) == {"lang": "en"}
+    assert not (tmp_path / ".config_updated").exists()
+
+
+def test_invalidate_cache_creates_timestamp_file(tmp_path):
+    cache = ConfigCacheService()
+    cache.set_cached_config("main", {"lang": "en"}, tmp_path)
+
+    cache.invalidate_cache(tmp_path)
+
+    assert (tmp_path / ".config_updated").exists()
+    assert cache.get_cached_config("main", tmp_path) is None
+
+
+def test_newer_timestamp_file_invalidates_entries_from_other_processes(tmp_path):
+    cache = ConfigCacheService()
+    timestamp_file = tmp_path / ".config_updated"
+    timestamp_file.touch()
+    cache.set_cached_config("main", {"lang": "en"}, tmp_path)
+    assert cache.get_cached_config("main", tmp_path) == {"lang": "en"}
+
+    # Another process touched the marker after this entry was cached
+    newer = os.path.getmtime(tmp_path) + 10
+    os.utime(timestamp_file, (newer, newer))
+
+    assert cache.get_cached_config("main", tmp_path) is None
+
+
+def test_unreadable_timestamp_file_never_serves_from_cache(tmp_path, monkeypatch):
+    cache = ConfigCacheService()
+    cache.set_cached_config("main", {"lang": "en"}, tmp_path)
+
+    def _denied(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(cache_module.os.path, "getmtime", _denied)
+
+    assert cache._get_timestamp_mtime(tmp_path) == float("inf")
+    assert cache.get_cached_config("main", tmp_path) is None
+
+
+def test_token_cache_requires_matching_token_and_password_hash():
+    cache = ConfigCacheService()
+    cache.set_cached_token("encrypted", "hash", "decrypted")
+
+    assert cache.get_cached_token("encrypted", "hash") == "decrypted"
+    assert cache.get_cached_token("encrypted", "other-hash") is None
+    assert cache.get_cached_token("other-token", "hash") is None
+
+
+def test_token_cache_key_keeps_token_and_hash_apart():
+    cache = ConfigCacheService()
+    cache.set_cached_token("ab", "c", "decrypted")
+
+    # A key built from the concatenated strings would make these two pairs collide
+    assert cache.get_cached_token("a", "bc") is None
+
+
+def test_invalidate_cache_clears_token_cache(tmp_path):
+    cache = ConfigCacheService()
+    cache.set_cached_token("encrypted", "hash", "decrypted")
+
+    cache.invalidate_cache()
+
+    assert cache.get_cached_token("encrypted", "hash") is None
+    assert not (tmp_path / ".config_updated").exists()
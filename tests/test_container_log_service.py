@@ -0,0 +1,542 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+from types import SimpleNamespace
+
+import pytest
+
+from services.web import container_log_service as log_module
+from services.web.container_log_service import ContainerLogService
+
+
+@pytest.fixture
+def service():
+    return ContainerLogService()
+
+
+def _set_log_paths(service, log_type, paths):
+    service.log_paths[log_type] = paths
+    service._viable_paths = service._find_viable_paths(service.log_paths)
+
+
+@pytest.mark.parametrize("max_lines", [1, 3, 50, 500])
+def test_read_log_file_matches_readlines_tail(service, tmp_path, monkeypatch, max_lines):
+    monkeypatch.setattr(log_module, "_TAIL_CHUNK_SIZE", 64)
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text("".join(f"line {i} äöü\n" for i in range(200)), encoding="utf-8")
+
+    with open(log_file, "r", encoding="utf-8", errors="replace") as f:
+        expected = "".join(f.readlines()[-max_lines:])
+
+    assert service._read_log_file(str(log_file), max_lines) == expected
+
+
+@pytest.mark.parametrize("max_lines", [1, 3, 50, 500])
+def test_read_log_file_mmap_path_matches_readlines_tail(service, tmp_path, monkeypatch, max_lines):
+    monkeypatch.setattr(log_module, "_MMAP_THRESHOLD", 0)
+    monkeypatch.setattr(log_module, "_read_tail", pytest.fail)
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text("".join(f"line {i} äöü\n" for i in range(200)), encoding="utf-8")
+
+    with open(log_file, "r", encoding="utf-8", errors="replace") as f:
+        expected = "".join(f.readlines()[-max_lines:])
+
+    assert service._read_log_file(str(log_file), max_lines) == expected
+
+
+def test_read_log_file_falls_back_to_pread_when_mmap_fails(service, tmp_path, monkeypatch):
+    monkeypatch.setattr(log_module, "_MMAP_THRESHOLD", 0)
+
+    def _shrunk(*args, **kwargs):
+        raise ValueError("cannot mmap an empty file")
+
+    monkeypatch.setattr(log_module.mmap, "mmap", _shrunk)
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text("".join(f"line {i}\n" for i in range(100)), encoding="utf-8")
+
+    assert service._read_log_file(str(log_file), 2) == "line 98\nline 99\n"
+
+
+def test_read_log_file_without_trailing_newline(service, tmp_path):
+    log_file = tmp_path / "bot.log"
+    log_file.write_bytes(b"first\r\nsecond\nthird")
+
+    assert service._read_log_file(str(log_file), 2) == "second\nthird"
+    assert service._read_log_file(str(tmp_path / "missing.log"), 2) is None
+
+
+def test_read_log_file_streams_non_regular_files(service, tmp_path, monkeypatch):
+    # Pipes and devices take the streaming path; a real FIFO would need a writer thread
+    monkeypatch.setattr(log_module.stat, "S_ISREG", lambda mode: False)
+    monkeypatch.setattr(log_module, "_read_tail", pytest.fail)
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text("".join(f"line {i}\n" for i in range(100)), encoding="utf-8")
+
+    assert service._read_log_file(str(log_file), 2) == "line 98\nline 99\n"
+
+
+def test_resolve_path_caches_until_ttl_expires(service, tmp_path, monkeypatch):
+    first = tmp_path / "first.log"
+    second = tmp_path / "second.log"
+    second.write_text("second\n", encoding="utf-8")
+    _set_log_paths(service, "bot", [str(first), str(second)])
+
+    clock = [100.0]
+    monkeypatch.setattr(log_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    assert service._resolve_path("bot") == str(second)
+    first.write_text("first\n", encoding="utf-8")
+    assert service._resolve_path("bot") == str(second)
+
+    clock[0] += log_module._PATH_TTL + 1
+    assert service._resolve_path("bot") == str(first)
+
+
+def test_read_log_type_rescans_after_file_disappears(service, tmp_path):
+    first = tmp_path / "first.log"
+    second = tmp_path / "second.log"
+    first.write_text("first\n", encoding="utf-8")
+    second.write_text("second\n", encoding="utf-8")
+    _set_log_paths(service, "discord", [str(first), str(second)])
+
+    assert service._read_log_type("discord", 10) == (str(first), "first\n")
+    first.unlink()
+    assert service._read_log_type("discord", 10) == (str(second), "second\n")
+    assert service._resolve_path("discord") == str(second)
+
+
+def test_read_log_type_falls_through_empty_first_candidate(service, tmp_path):
+    first = tmp_path / "first.log"
+    second = tmp_path / "second.log"
+    first.write_text("", encoding="utf-8")
+    second.write_text("second\n", encoding="utf-8")
+    _set_log_paths(service, "bot", [str(first), str(second)])
+
+    assert service._read_log_type("bot", 10) == (str(second), "second\n")
+    second.write_text("  \n", encoding="utf-8")
+    assert service._read_log_type("bot", 10) == (str(first), None)
+
+
+def test_filtered_container_logs_match_case_insensitively(service, monkeypatch):
+    logs = "\n".join([
+        "2025-01-01 starting GUNICORN worker",
+        "unrelated line",
+        "GET /api/status 200",
+        "Werkzeug reloader",
+    ])
+    _set_log_paths(service, "container", [])
+    monkeypatch.setattr(service, "_get_container_logs_sync", lambda name, lines: logs)
+
+    result = service._get_filtered_container_logs(
+        10, log_module._WEBUI_FILTERS, "No Web UI logs found"
+    )
+
+    assert result.success is True
+    assert result.content.split("\n") == [
+        "2025-01-01 starting GUNICORN worker",
+        "GET /api/status 200",
+        "Werkzeug reloader",
+    ]
+
+
+def test_filtered_container_logs_keep_newest_matches(service, monkeypatch):
+    logs = "\n".join(f"GET /page/{i}" if i % 2 else "noise" for i in range(20))
+    _set_log_paths(service, "container", [])
+    monkeypatch.setattr(service, "_get_container_logs_sync", lambda name, lines: logs)
+
+    result = service._get_filtered_container_logs(
+        2, log_module._WEBUI_FILTERS, "No Web UI logs found"
+    )
+
+    assert result.content == "GET /page/17\nGET /page/19"
+
+
+def test_filtered_container_logs_fetch_more_until_enough_matches(service, monkeypatch):
+    log_lines = [f"GET /page/{i}" if i % 10 == 0 else "noise" for i in range(100)]
+    requested = []
+
+    def _fake_sync(name, lines):
+        requested.append(lines)
+        return "\n".join(log_lines[-lines:])
+
+    _set_log_paths(service, "container", [])
+    monkeypatch.setattr(service, "_get_container_logs_sync", _fake_sync)
+
+    result = service._get_filtered_container_logs(3, log_module._WEBUI_FILTERS, "none")
+    assert result.content == "GET /page/70\nGET /page/80\nGET /page/90"
+    assert requested == [3, 6, 12, 24, 48]
+
+    # A log that runs out before enough lines match stops the doubling
+    requested.clear()
+    result = service._get_filtered_container_logs(20, log_module._WEBUI_FILTERS, "none")
+    assert len(result.content.split("\n")) == 10
+    assert requested == [20, 40, 80, 160]
+
+
+def test_filtered_logs_scan_container_file_backwards(service, tmp_path, monkeypatch):
+    monkeypatch.setattr(log_module, "_TAIL_CHUNK_SIZE", 32)
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text(
+        "".join(f"{'guild event' if i % 3 == 0 else 'noise'} {i}\n" for i in range(300)),
+        encoding="utf-8",
+    )
+    _set_log_paths(service, "container", [str(log_file)])
+    monkeypatch.setattr(service, "_get_container_logs_sync", pytest.fail)
+
+    result = service._get_filtered_container_logs(
+        4, log_module._DISCORD_FILTERS, "No Discord logs found"
+    )
+
+    assert result.content.split("\n") == [
+        "guild event 288", "guild event 291", "guild event 294", "guild event 297"
+    ]
+
+
+def test_tail_filter_file_includes_first_line(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_module, "_TAIL_CHUNK_SIZE", 8)
+    log_file = tmp_path / "short.log"
+    log_file.write_bytes(b"Flask first\nnoise\nflask last")
+
+    pattern = log_module._compile_byte_filters(("flask",))
+    assert log_module._tail_filter_file(str(log_file), 10, pattern) == ["Flask first", "flask last"]
+
+
+class _DockerException(Exception):
+    pass
+
+
+class _APIError(_DockerException):
+    pass
+
+
+class _NotFound(_APIError):
+    pass
+
+
+class _FakeLogStream:
+    """Finite stand-in for docker-py's log stream; rejects follow streams."""
+
+    closed = []
+
+    def __init__(self, data, stream=False, follow=None, **kwargs):
+        # docker-py follows whenever follow is left unset and stream=True
+        assert stream is True and follow is False
+        self._chunks = iter([data])
+
+    def __iter__(self):
+        return self._chunks
+
+    def close(self):
+        _FakeLogStream.closed.append(self)
+
+
+def _install_fake_docker(monkeypatch, *outcomes):
+    """Swap in a stand-in docker module whose containers.get() yields outcomes in order."""
+    calls = []
+
+    def _get(name):
+        outcome = outcomes[len(calls)]
+        calls.append(name)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return SimpleNamespace(logs=lambda **kwargs: _FakeLogStream(outcome, **kwargs))
+
+    def _from_env(**kwargs):
+        clients.append(SimpleNamespace(
+            containers=SimpleNamespace(get=_get), ping=_ping, close=lambda: None
+        ))
+        return clients[-1]
+
+    def _ping():
+        if pings and pings.pop(0) is False:
+            raise OSError("socket closed")
+        return True
+
+    clients = []
+    pings = []
+    fake_docker = SimpleNamespace(
+        from_env=_from_env,
+        errors=SimpleNamespace(
+            NotFound=_NotFound, APIError=_APIError, DockerException=_DockerException
+        ),
+        clients=clients,
+        pings=pings,
+    )
+    monkeypatch.setattr(log_module, "docker", fake_docker)
+    monkeypatch.setattr(log_module, "_DockerNotFound", _NotFound)
+    monkeypatch.setattr(log_module, "_DockerAPIError", _APIError)
+    monkeypatch.setattr(log_module, "_DockerException", _DockerException)
+    return calls
+
+
+def test_container_logs_sync_retries_transient_error(service, monkeypatch):
+    calls = _install_fake_docker(monkeypatch, _APIError("busy"), b"line 1\nline 2")
+
+    _FakeLogStream.closed.clear()
+    assert service._get_container_logs_sync("ddc", 10) == "line 1\nline 2"
+    assert calls == ["ddc", "ddc"]
+    assert len(_FakeLogStream.closed) == 1
+
+
+def test_container_logs_sync_does_not_retry_missing_container(service, monkeypatch):
+    calls = _install_fake_docker(monkeypatch, _NotFound("gone"), b"unused")
+
+    assert service._get_container_logs_sync("missing", 10) is None
+    assert calls == ["missing"]
+
+
+def test_docker_client_is_reused_and_replaced_when_stale(service, monkeypatch):
+    calls = _install_fake_docker(monkeypatch, b"first", b"second", b"third")
+    fake_docker = log_module.docker
+    clock = [100.0]
+    monkeypatch.setattr(log_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    assert service._get_container_logs_sync("ddc", 10) == "first"
+    clock[0] += log_module._CLIENT_PING_TTL - 1
+    assert service._get_container_logs_sync("ddc", 10) == "second"
+    assert len(fake_docker.clients) == 1
+
+    # Once the TTL has passed a failed ping replaces the client
+    clock[0] += 2
+    fake_docker.pings.append(False)
+    assert service._get_container_logs_sync("ddc", 10) == "third"
+    assert len(fake_docker.clients) == 2
+    assert calls == ["ddc", "ddc", "ddc"]
+
+
+def test_tail_stream_keeps_last_lines_within_byte_budget():
+    chunks = [b"line 1\nli", b"ne 2\n", b"line 3\nline 4\n", b"line 5"]
+    marker = log_module._TRUNCATION_MARKER
+
+    assert log_module._tail_stream(chunks, 3, 1024) == "line 3\nline 4\nline 5"
+    # Over the budget the oldest lines go and the tail is marked as truncated
+    assert log_module._tail_stream(chunks, 10, 12) == f"{marker}\nline 4\nline 5"
+    # A single oversized line keeps its end
+    assert log_module._tail_stream([b"x" * 30, b"y" * 30], 10, 8) == f"{marker}\n{'y' * 8}"
+
+
+def test_tail_stream_reads_whole_stream_when_byte_budget_is_hit():
+    consumed = []
+
+    def _stream():
+        for i in range(100):
+            consumed.append(i)
+            yield f"busy container output {i:02d}\n".encode()
+
+    tail = log_module._tail_stream(_stream(), 10, 60)
+
+    assert len(consumed) == 100
+    assert tail == (
+        f"{log_module._TRUNCATION_MARKER}\n"
+        "busy container output 98\nbusy container output 99"
+    )
+    # A character cut in half by the budget is dropped rather than replaced
+    assert log_module._tail_stream([b"caf\xc3\xa9"], 10, 4) == (
+        f"{log_module._TRUNCATION_MARKER}\naf\u00e9"
+    )
+
+
+def test_tail_stream_decodes_characters_split_across_chunks():
+    chunks = [b"caf\xc3", b"\xa9 open\n\xe2\x9c", b"\x93 done"]
+
+    assert log_module._tail_stream(chunks, 10, 1024) == "café open\n✓ done"
+    assert log_module._tail_stream([b"bad \xff\n"], 10, 1024) == "bad �"
+
+
+def test_repeated_requests_share_result_until_ttl_or_clear(service, tmp_path, monkeypatch):
+    log_file = tmp_path / "bot.log"
+    log_file.write_text("first\n", encoding="utf-8")
+    _set_log_paths(service, "bot", [str(log_file)])
+    clock = [100.0]
+    monkeypatch.setattr(log_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    request = log_module.FilteredLogRequest(log_type=log_module.LogType.BOT, max_lines=10)
+
+    assert service.get_filtered_logs(request).content == "first\n"
+    log_file.write_text("second\n", encoding="utf-8")
+    assert service.get_filtered_logs(request).content == "first\n"
+
+    clock[0] += log_module._RESULT_TTL
+    assert service.get_filtered_logs(request).content == "second\n"
+
+    log_file.write_text("third\n", encoding="utf-8")
+    service.clear_logs(log_module.ClearLogRequest(log_type="bot"))
+    assert service.get_filtered_logs(request).content == "third\n"
+
+
+def test_concurrent_identical_requests_share_one_load(service, monkeypatch):
+    import threading
+
+    waiting = threading.Semaphore(0)
+
+    class _CountingFuture(log_module.Future):
+        def result(self, timeout=None):
+            waiting.release()
+            return super().result(timeout)
+
+    monkeypatch.setattr(log_module, "Future", _CountingFuture)
+    # Without the result cache every late caller would have to load again
+    monkeypatch.setattr(service, "_remember_result", lambda key, result: None)
+
+    started = threading.Event()
+    release = threading.Event()
+    loads = []
+
+    def _slow_load(request):
+        loads.append(request.container_name)
+        started.set()
+        release.wait(5)
+        return log_module.LogResult(success=True, content="shared")
+
+    monkeypatch.setattr(service, "_load_container_logs", _slow_load)
+    request = log_module.ContainerLogRequest(container_name="ddc", max_lines=10)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.get_container_logs(request)))
+               for _ in range(4)]
+
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    for _ in threads[1:]:
+        assert waiting.acquire(timeout=5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert loads == ["ddc"]
+    assert [result.content for result in results] == ["shared"] * 4
+    assert service._in_flight == {}
+
+
+def test_tail_filter_file_matches_bytes_case_insensitively(tmp_path):
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_bytes(b"GUILD joined \xff\nnoise\nWerkzeug: Ready f\xc3\xbcr requests\n")
+
+    pattern = log_module._compile_byte_filters(
+        log_module._DISCORD_FILTERS + log_module._WEBUI_FILTERS
+    )
+    assert log_module._tail_filter_file(str(log_file), 10, pattern) == [
+        "GUILD joined �",
+        "Werkzeug: Ready für requests",
+    ]
+
+
+def test_aget_container_logs_reads_off_the_event_loop_thread(service, monkeypatch):
+    import asyncio
+    import threading
+
+    threads = []
+
+    def _load(request):
+        threads.append(threading.get_ident())
+        return log_module.LogResult(success=True, content="from worker")
+
+    monkeypatch.setattr(service, "_load_container_logs", _load)
+    request = log_module.ContainerLogRequest(container_name="ddc", max_lines=10)
+
+    loop = asyncio.new_event_loop()
+    try:
+        result = loop.run_until_complete(service.aget_container_logs(request))
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+    assert result.content == "from worker"
+    assert threads and threads[0] != threading.get_ident()
+
+
+@pytest.mark.parametrize("name, valid", [
+    ("ddc", True),
+    ("my-app_1.2", True),
+    ("", False),
+    ("bad name", False),
+    ("ddc\n", False),
+    (None, False),
+])
+def test_validate_container_name_fallback(service, name, valid):
+    service._external_validator = None
+
+    assert service._validate_container_name(name) is valid
+
+
+def test_container_logs_sync_without_docker_sdk(service, monkeypatch):
+    monkeypatch.setattr(log_module, "docker", None)
+
+    assert service._get_container_logs_sync("ddc", 10) is None
+
+
+def test_filtered_logs_reject_unsupported_log_type(service):
+    request = log_module.FilteredLogRequest(log_type=log_module.LogType.ACTION)
+    result = service.get_filtered_logs(request)
+
+    assert result.success is False
+    assert result.status_code == 400
+
+
+def test_viable_paths_skip_missing_directories(service, tmp_path, monkeypatch):
+    present = tmp_path / "logs"
+    present.mkdir()
+    late = tmp_path / "late"
+    _set_log_paths(
+        service, "bot", [str(tmp_path / "missing" / "bot.log"), str(present / "bot.log")]
+    )
+    _set_log_paths(service, "discord", [str(late / "discord.log")])
+
+    assert service._viable_paths["bot"] == [str(present / "bot.log")]
+    assert service._viable_paths["discord"] == []
+
+    # A directory created after start-up is found on the next probe
+    late.mkdir()
+    (late / "discord.log").write_text("ready\n", encoding="utf-8")
+    assert service._resolve_path("discord") == str(late / "discord.log")
+
+
+def test_clear_logs_returns_precomputed_response(service):
+    bot = service.clear_logs(log_module.ClearLogRequest(log_type="bot"))
+    unknown = service.clear_logs(log_module.ClearLogRequest(log_type="<script>"))
+
+    assert bot.data["message"].startswith("Bot logs cleared")
+    assert unknown is service.clear_logs(log_module.ClearLogRequest())
+    assert unknown.data["message"].startswith("Container logs cleared")
+
+
+def test_result_cache_eviction_is_not_interleaved_with_clear(service, monkeypatch):
+    import threading
+
+    clock = [100.0]
+    monkeypatch.setattr(log_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(log_module, "_RESULT_CACHE_SIZE", 4)
+    result = log_module.LogResult(success=True, content="cached")
+    clearers = []
+
+    class _InterleavingDict(dict):
+        """Starts a concurrent clear_logs() after eviction has begun iterating."""
+
+        def items(self):
+            entries = iter(super().items())
+            yield next(entries)
+            clear_request = log_module.ClearLogRequest()
+            clearer = threading.Thread(target=service.clear_logs, args=(clear_request,))
+            clearers.append(clearer)
+            clearer.start()
+            # Unguarded, the clear would land here and break the iteration
+            clearer.join(0.2)
+            yield from entries
+
+    service._result_cache = _InterleavingDict()
+    for i in range(4):
+        service._remember_result(("old", i), result)
+    clock[0] += log_module._RESULT_TTL
+
+    service._remember_result(("new",), result)
+    for clearer in clearers:
+        clearer.join(5)
+
+    assert len(clearers) == 1
+    # The clear waited for the insert to finish, so it removed the new entry too
+    assert service._result_cache == {}
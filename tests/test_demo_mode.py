@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+from app import demo_mode
+
+
+def test_filter_containers_for_demo_tags_copies(monkeypatch):
+    monkeypatch.setattr(demo_mode, "DEMO_MODE_ENABLED", True)
+    shared = [{"name": "ddc"}, {"container_name": "minecraft"}]
+
+    tagged = demo_mode.filter_containers_for_demo(shared)
+
+    assert tagged == [
+        {"name": "ddc", "demo_protected": True},
+        {"container_name": "minecraft", "demo_protected": False},
+    ]
+    # The shared status dicts must not pick up the demo flag
+    assert shared == [{"name": "ddc"}, {"container_name": "minecraft"}]
+
+
+def test_filter_containers_for_demo_is_identity_outside_demo_mode(monkeypatch):
+    monkeypatch.setattr(demo_mode, "DEMO_MODE_ENABLED", False)
+    containers = [{"name": "ddc"}]
+
+    assert demo_mode.filter_containers_for_demo(containers) is containers
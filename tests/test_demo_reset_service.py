@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+from services.demo import demo_reset_service as reset_module
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_fast_clone_copies_content(tmp_path):
+    src = tmp_path / "src.json"
+    dst = tmp_path / "dst.json"
+    _write(src, '{"name": "minecraft"}')
+    _write(dst, '{"name": "something much longer than the source"}')
+
+    reset_module._fast_clone(src, dst)
+
+    assert dst.read_text(encoding="utf-8") == '{"name": "minecraft"}'
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_sync_tree_mirrors_source_in_place(tmp_path):
+    src = tmp_path / "defaults" / "containers"
+    dst = tmp_path / "config" / "containers"
+    _write(src / "minecraft.json", "default")
+    _write(src / "nested" / "valheim.json", "default")
+    _write(dst / "minecraft.json", "edited by a demo user")
+    _write(dst / "added_by_user.json", "stale")
+    _write(dst / "stale_dir" / "file.json", "stale")
+
+    reset_module._sync_tree(src, dst)
+
+    assert sorted(p.relative_to(dst).as_posix() for p in dst.rglob("*")) == [
+        "minecraft.json",
+        "nested",
+        "nested/valheim.json",
+    ]
+    assert (dst / "minecraft.json").read_text(encoding="utf-8") == "default"
+    assert (dst / "nested" / "valheim.json").read_text(encoding="utf-8") == "default"
+
+
+def test_sync_tree_skips_unchanged_files(tmp_path, monkeypatch):
+    src = tmp_path / "defaults" / "channels"
+    dst = tmp_path / "config" / "channels"
+    _write(src / "unchanged.json", "same")
+    _write(src / "changed.json", "default")
+    reset_module._sync_tree(src, dst)
+    _write(dst / "changed.json", "edited")
+
+    cloned = []
+    original_clone = reset_module._fast_clone
+
+    def _recording_clone(src_path, dst_path):
+        cloned.append(reset_module.os.path.basename(dst_path))
+        original_clone(src_path, dst_path)
+
+    monkeypatch.setattr(reset_module, "_fast_clone", _recording_clone)
+    reset_module._sync_tree(src, dst)
+
+    assert cloned == ["changed.json"]
+    assert (dst / "changed.json").read_text(encoding="utf-8") == "default"
+
+
+def test_next_reset_time_is_next_full_hour():
+    from datetime import datetime
+
+    assert reset_module.DemoResetService._next_reset_time(
+        datetime(2025, 1, 1, 12, 34, 56)
+    ) == datetime(2025, 1, 1, 13, 0)
+    assert reset_module.DemoResetService._next_reset_time(
+        datetime(2025, 1, 1, 13, 0)
+    ) == datetime(2025, 1, 1, 14, 0)
+
+
+def test_stop_interrupts_wait(monkeypatch, tmp_path):
+    monkeypatch.setattr(reset_module, "is_demo_mode", lambda: True)
+    service = reset_module.DemoResetService()
+    service.config_dir = tmp_path
+    service.defaults_dir = tmp_path / reset_module.DEMO_DEFAULTS_DIR
+
+    assert service.start() is True
+    assert service.running is True
+    assert service.stop() is True
+    assert not service.thread.is_alive()
+    assert service.running is False
+
+
+def test_restore_file_serves_defaults_from_memory(tmp_path, monkeypatch):
+    service = reset_module.DemoResetService()
+    src = tmp_path / "defaults" / "config.json"
+    dst = tmp_path / "config" / "config.json"
+    _write(src, '{"language": "en"}')
+    dst.parent.mkdir(parents=True)
+
+    service._restore_file(src, dst)
+    _write(dst, '{"language": "de"}')
+
+    real_open = open
+    reads = []
+
+    def _tracking_open(path, mode="r", *args, **kwargs):
+        if "r" in mode:
+            reads.append(str(path))
+        return real_open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", _tracking_open)
+    service._restore_file(src, dst)
+
+    assert reads == []
+    assert dst.read_text(encoding="utf-8") == '{"language": "en"}'
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_async_force_reset_runs_in_executor(monkeypatch):
+    import asyncio
+    import threading
+
+    monkeypatch.setattr(reset_module, "is_demo_mode", lambda: True)
+    service = reset_module.DemoResetService()
+    reset_threads = []
+    monkeypatch.setattr(
+        service, "_reset_to_defaults", lambda: reset_threads.append(threading.get_ident())
+    )
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(service.async_force_reset()) is True
+    finally:
+        # Join the default executor's worker so it doesn't leak into later tests
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+    assert reset_threads and reset_threads[0] != threading.get_ident()
+
+
+def test_swap_in_tree_replaces_live_directory_and_recycles_old_tree(tmp_path):
+    service = reset_module.DemoResetService()
+    src = tmp_path / "defaults" / "containers"
+    live = tmp_path / "config" / "containers"
+    _write(src / "minecraft.json", "default")
+    _write(live / "minecraft.json", "edited")
+    _write(live / "extra.json", "added by user")
+
+    service._swap_in_tree(src, live)
+
+    assert sorted(p.name for p in live.iterdir()) == ["minecraft.json"]
+    assert (live / "minecraft.json").read_text(encoding="utf-8") == "default"
+    previous = tmp_path / "config" / ".containers.old"
+    assert (previous / "extra.json").exists()
+    assert not (tmp_path / "config" / ".containers.new").exists()
+
+    # The next reset reuses the previous tree as its staging directory
+    service._swap_in_tree(src, live)
+    assert sorted(p.name for p in live.iterdir()) == ["minecraft.json"]
+    assert sorted(p.name for p in previous.iterdir()) == ["minecraft.json"]
+
+
+def test_save_and_reset_round_trip(monkeypatch, tmp_path):
+    monkeypatch.setattr(reset_module, "is_demo_mode", lambda: True)
+    service = reset_module.DemoResetService()
+    service.config_dir = tmp_path / "config"
+    service.defaults_dir = service.config_dir / reset_module.DEMO_DEFAULTS_DIR
+    monkeypatch.setattr(service, "_stop_demo_containers", lambda: None)
+
+    _write(service.config_dir / "config.json", '{"language": "en"}')
+    _write(service.config_dir / "tasks.json", "[]")
+    _write(service.config_dir / "containers" / "minecraft.json", "default")
+    _write(service.config_dir / "unrelated.json", "not backed up")
+
+    assert service.save_current_as_new_defaults() is True
+    assert sorted(p.name for p in service.defaults_dir.iterdir()) == [
+        ".defaults.pack.json",
+        ".defaults_created",
+        "config.json",
+        "containers",
+        "tasks.json",
+    ]
+
+    _write(service.config_dir / "config.json", '{"language": "de"}')
+    _write(service.config_dir / "containers" / "minecraft.json", "edited")
+
+    assert service.force_reset() is True
+    assert (service.config_dir / "config.json").read_text(encoding="utf-8") == '{"language": "en"}'
+    minecraft = service.config_dir / "containers" / "minecraft.json"
+    assert minecraft.read_text(encoding="utf-8") == "default"
+    assert (service.config_dir / "unrelated.json").read_text(encoding="utf-8") == "not backed up"
+
+
+def test_snapshot_warms_cache_for_new_service(monkeypatch, tmp_path):
+    monkeypatch.setattr(reset_module, "is_demo_mode", lambda: True)
+
+    def _make_service():
+        service = reset_module.DemoResetService()
+        service.config_dir = tmp_path / "config"
+        service.defaults_dir = service.config_dir / reset_module.DEMO_DEFAULTS_DIR
+        monkeypatch.setattr(service, "_stop_demo_containers", lambda: None)
+        return service
+
+    first = _make_service()
+    _write(first.config_dir / "config.json", '{"language": "en"}')
+    _write(first.config_dir / "channels" / "123.json", '{"name": "general"}')
+    first.save_current_as_new_defaults()
+    assert (first.defaults_dir / reset_module.SNAPSHOT_FILE).exists()
+
+    # A fresh instance (e.g. after a restart) loads all defaults from the snapshot
+    second = _make_service()
+    second._load_snapshot()
+    assert second._defaults_cache == first._defaults_cache
+    assert len(second._defaults_cache) == 2
+
+    _write(second.config_dir / "channels" / "123.json", '{"name": "edited"}')
+    assert second.force_reset() is True
+    channel = second.config_dir / "channels" / "123.json"
+    assert channel.read_text(encoding="utf-8") == '{"name": "general"}'
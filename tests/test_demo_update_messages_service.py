@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+from services.demo import demo_update_messages_service as messages_module
+
+
+def test_templates_match_legacy_message_format():
+    assert len(messages_module.DEMO_UPDATE_TEMPLATES) == len(messages_module.DEMO_UPDATE_MESSAGES)
+
+    for entry, (container, template) in zip(
+        messages_module.DEMO_UPDATE_MESSAGES, messages_module.DEMO_UPDATE_TEMPLATES
+    ):
+        expected = (
+            f"**{entry['title']}**\n"
+            f"— 01.02.25, 13:37\n\n"
+            f"{entry['content']}{messages_module.DISCLAIMER}"
+        )
+        assert container == entry["container"]
+        assert template.format(ts="01.02.25, 13:37") == expected
+
+
+def test_plan_hour_draws_sorted_schedule_within_remaining_hour():
+    service = messages_module.DemoUpdateMessagesService(bot=None)
+
+    service._plan_hour(1800.0)
+
+    assert len(service._schedule) == messages_module.MESSAGES_PER_HOUR
+    assert service._schedule == sorted(service._schedule)
+    assert all(1800.0 <= offset <= messages_module.SECONDS_PER_HOUR for offset in service._schedule)
+    assert service._schedule_idx == 0
+
+
+class _StubChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+
+
+class _StubBot:
+    def __init__(self, channel=None):
+        self.channel = channel
+        self.lookups = 0
+
+    def get_channel(self, channel_id):
+        self.lookups += 1
+        return self.channel
+
+
+def _run(coro):
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+def test_send_uses_resolved_channel_without_repeated_lookups():
+    channel = _StubChannel()
+    bot = _StubBot(channel)
+    service = messages_module.DemoUpdateMessagesService(bot)
+    service._channel = bot.get_channel(messages_module.UPDATE_CHANNEL_ID)
+
+    _run(service._send_random_message())
+    _run(service._send_random_message())
+
+    assert len(channel.sent) == 2
+    assert bot.lookups == 1
+
+
+def test_missing_channel_is_looked_up_again_on_next_send():
+    bot = _StubBot(channel=None)
+    service = messages_module.DemoUpdateMessagesService(bot)
+    service.running = True
+
+    _run(service._send_random_message())
+    assert bot.lookups == 1
+    assert service.running is True
+
+    # The channel shows up in the bot's cache later
+    bot.channel = _StubChannel()
+    _run(service._send_random_message())
+    _run(service._send_random_message())
+
+    assert bot.lookups == 2
+    assert len(bot.channel.sent) == 2
+    assert service.running is True
+
+
+def test_failed_send_drops_cached_channel():
+    class _FailingChannel:
+        async def send(self, content=None, **kwargs):
+            raise RuntimeError("Unknown Channel")
+
+    bot = _StubBot(_StubChannel())
+    service = messages_module.DemoUpdateMessagesService(bot)
+    service._channel = _FailingChannel()
+
+    _run(service._send_random_message())
+    _run(service._send_random_message())
+
+    assert bot.lookups == 1
+    assert len(bot.channel.sent) == 1
+
+
+def test_overdue_messages_are_packed_under_discord_limit():
+    channel = _StubChannel()
+    service = messages_module.DemoUpdateMessagesService(_StubBot(channel))
+    service._channel = channel
+
+    _run(service._send_random_message(count=12))
+
+    assert 1 < len(channel.sent) < 12
+    assert all(len(message) <= messages_module.DISCORD_MESSAGE_LIMIT for message in channel.sent)
+    assert sum(message.count(messages_module.DISCLAIMER) for message in channel.sent) == 12
+
+
+def test_start_follows_ddc_mode_after_cache_clear(monkeypatch):
+    from services.demo import is_demo_mode
+
+    monkeypatch.setenv("DDC_MODE", "production")
+    is_demo_mode.cache_clear()
+    try:
+        service = messages_module.DemoUpdateMessagesService(_StubBot(_StubChannel()))
+        assert _run(service.start()) is False
+        assert service.running is False
+    finally:
+        monkeypatch.delenv("DDC_MODE")
+        is_demo_mode.cache_clear()
+
+
+def test_each_message_is_used_once_per_hour():
+    service = messages_module.DemoUpdateMessagesService(_StubBot(_StubChannel()))
+    service._plan_hour(0.0)
+
+    picked = [service._next_template() for _ in messages_module.DEMO_UPDATE_TEMPLATES]
+
+    assert sorted(picked) == sorted(messages_module.DEMO_UPDATE_TEMPLATES)
+
+
+def test_cog_unload_stops_service_and_reload_starts_one_sender(monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+
+    from cogs.docker_control import DockerControlCog
+
+    monkeypatch.setattr(messages_module, "is_demo_mode", lambda: True)
+    monkeypatch.setattr(messages_module, "_service_instance", None)
+
+    async def _drain():
+        current = asyncio.current_task()
+        pending = [t for t in asyncio.all_tasks() if t is not current]
+        await asyncio.wait_for(asyncio.gather(*pending), 1)
+
+    async def _load(bot):
+        # Mirrors setup(): the start is scheduled on the bot loop and the handle kept
+        cog = SimpleNamespace(bot=bot)
+        cog.demo_update_messages_task = bot.loop.create_task(
+            messages_module.start_demo_update_messages_service(bot)
+        )
+        await asyncio.sleep(0)
+        return cog
+
+    async def _reload():
+        bot = _StubBot(_StubChannel())
+        bot.loop = asyncio.get_running_loop()
+        cog = await _load(bot)
+        service = messages_module.get_demo_update_messages_service()
+        first_task = service.task
+        assert service.running is True
+
+        DockerControlCog.cog_unload(cog)
+        cog = await _load(bot)
+        assert service.running is True
+        assert service.task is not first_task
+        # The old loop winds down without taking the new sender with it
+        await asyncio.wait_for(first_task, 1)
+        assert service.running is True
+
+        DockerControlCog.cog_unload(cog)
+        await _drain()
+        assert service.running is False
+        assert service.task.done()
+
+    _run(_reload())
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""Tests for the fallback helpers in the log blueprint."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.blueprints import log_routes
+from app.blueprints.log_routes import _tail_bytes
+
+
+@pytest.fixture(autouse=True)
+def reset_log_path_cache():
+    log_routes._LOG_PATH_CACHE.update(path=None, expires=0.0)
+    log_routes._simple_read_logs_bucketed.cache_clear()
+    yield
+    log_routes._LOG_PATH_CACHE.update(path=None, expires=0.0)
+    log_routes._simple_read_logs_bucketed.cache_clear()
+
+
+def test_tail_bytes_matches_readlines_slice(tmp_path):
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text("".join(f"line {i}\n" for i in range(1000)), encoding="utf-8")
+
+    expected = "".join(log_file.read_text(encoding="utf-8").splitlines(keepends=True)[-25:])
+
+    assert _tail_bytes(str(log_file), 25, block=64) == expected
+
+
+def test_tail_bytes_handles_short_files_without_trailing_newline(tmp_path):
+    log_file = tmp_path / "bot.log"
+    log_file.write_bytes(b"first\nsecond\nthird")
+
+    assert _tail_bytes(str(log_file), 10) == "first\nsecond\nthird"
+    assert _tail_bytes(str(log_file), 1) == "third"
+
+
+def test_simple_read_logs_caches_resolved_path(tmp_path, monkeypatch):
+    first = tmp_path / "supervisord.log"
+    second = tmp_path / "bot.log"
+    second.write_text("bot line\n", encoding="utf-8")
+    monkeypatch.setattr(log_routes, "_LOG_PATHS", (str(first), str(second)))
+
+    assert log_routes._simple_read_logs() == "bot line\n"
+
+    # A newly created higher-priority file is ignored until the TTL expires
+    first.write_text("supervisor line\n", encoding="utf-8")
+    assert log_routes._simple_read_logs() == "bot line\n"
+
+    log_routes._LOG_PATH_CACHE["expires"] = 0.0
+    assert log_routes._simple_read_logs() == "supervisor line\n"
+
+
+def test_simple_read_logs_rescans_when_cached_file_disappears(tmp_path, monkeypatch):
+    first = tmp_path / "supervisord.log"
+    second = tmp_path / "bot.log"
+    first.write_text("supervisor line\n", encoding="utf-8")
+    second.write_text("bot line\n", encoding="utf-8")
+    monkeypatch.setattr(log_routes, "_LOG_PATHS", (str(first), str(second)))
+
+    assert log_routes._simple_read_logs() == "supervisor line\n"
+
+    first.unlink()
+    assert log_routes._simple_read_logs() == "bot line\n"
+
+
+def test_fallback_response_streams_docker_chunks(monkeypatch):
+    from unittest.mock import Mock
+
+    from flask import Flask
+
+    container = Mock()
+    container.logs.return_value = iter([b"first\n", b"second\n"])
+    client = Mock()
+    client.containers.get.return_value = container
+    monkeypatch.setattr(log_routes, "_get_docker_client", lambda: client)
+
+    app = Flask(__name__)
+    with app.test_request_context():
+        response = log_routes._fallback_logs_response("ddc", "Fallback mode")
+        assert response.direct_passthrough
+        assert b"".join(response.response) == b"[Fallback mode]\nfirst\nsecond\n"
+
+    container.logs.assert_called_once_with(
+        tail=500, stdout=True, stderr=True, stream=True, follow=False
+    )
+
+
+def test_fallback_response_uses_log_file_when_docker_unavailable(tmp_path, monkeypatch):
+    from flask import Flask
+
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text("supervisor line\n", encoding="utf-8")
+    monkeypatch.setattr(log_routes, "_LOG_PATHS", (str(log_file),))
+    monkeypatch.setattr(log_routes, "_simple_docker_logs", lambda name: None)
+
+    app = Flask(__name__)
+    with app.test_request_context():
+        response = log_routes._fallback_logs_response("ddc", "Fallback mode")
+        assert response.get_data(as_text=True) == "[Fallback mode]\nsupervisor line\n"
+
+
+def test_cached_read_shares_result_within_ttl_bucket(tmp_path, monkeypatch):
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text("old line\n", encoding="utf-8")
+    monkeypatch.setattr(log_routes, "_LOG_PATHS", (str(log_file),))
+    monkeypatch.setattr(log_routes, "time", SimpleNamespace(monotonic=lambda: 100.0))
+
+    assert log_routes._simple_read_logs_cached() == "old line\n"
+
+    log_file.write_text("new line\n", encoding="utf-8")
+    assert log_routes._simple_read_logs_cached() == "old line\n"
+
+    monkeypatch.setattr(
+        log_routes, "time", SimpleNamespace(monotonic=lambda: 100.0 + log_routes._LOG_TAIL_TTL)
+    )
+    assert log_routes._simple_read_logs_cached() == "new line\n"
+
+
+def test_fallback_response_closes_docker_stream_that_arrives_late(tmp_path, monkeypatch):
+    import threading
+
+    from flask import Flask
+
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text("supervisor line\n", encoding="utf-8")
+    monkeypatch.setattr(log_routes, "_LOG_PATHS", (str(log_file),))
+    monkeypatch.setattr(log_routes, "_FALLBACK_TIMEOUT", 0.05)
+
+    release = threading.Event()
+    closed = threading.Event()
+    logs_iter = SimpleNamespace(close=closed.set)
+
+    def _slow_docker_logs(name):
+        release.wait(5)
+        return log_routes._DockerLogStream(b"late\n", logs_iter)
+
+    monkeypatch.setattr(log_routes, "_simple_docker_logs", _slow_docker_logs)
+
+    app = Flask(__name__)
+    with app.test_request_context():
+        response = log_routes._fallback_logs_response("ddc", "Fallback mode")
+        assert response.get_data(as_text=True) == "[Fallback mode]\nsupervisor line\n"
+
+    release.set()
+    assert closed.wait(5)
+
+
+def test_file_fallback_still_served_while_docker_hangs(tmp_path, monkeypatch):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from flask import Flask
+
+    log_file = tmp_path / "supervisord.log"
+    log_file.write_text("supervisor line\n", encoding="utf-8")
+    monkeypatch.setattr(log_routes, "_LOG_PATHS", (str(log_file),))
+    monkeypatch.setattr(log_routes, "_FALLBACK_TIMEOUT", 0.05)
+
+    release = threading.Event()
+    started = []
+
+    def _hanging_docker_logs(name):
+        started.append(name)
+        release.wait(5)
+        return None
+
+    monkeypatch.setattr(log_routes, "_simple_docker_logs", _hanging_docker_logs)
+    # Private pool so the stuck workers can be joined instead of leaking into later tests
+    pool = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(log_routes, "_FALLBACK_POOL", pool)
+
+    app = Flask(__name__)
+    try:
+        with app.test_request_context():
+            # More requests than fallback workers: later Docker fetches queue up
+            # behind the stuck ones, but the file tail must still be served
+            for _ in range(6):
+                response = log_routes._fallback_logs_response("ddc", "Fallback mode")
+                assert response.get_data(as_text=True) == "[Fallback mode]\nsupervisor line\n"
+        # Fetches that never got a worker are dropped rather than run later
+        assert len(started) <= 4
+    finally:
+        release.set()
+        pool.shutdown(wait=True)
+
+
+def test_fallback_docker_client_uses_short_timeout(monkeypatch):
+    calls = []
+    fake_docker = SimpleNamespace(from_env=lambda **kwargs: calls.append(kwargs) or object())
+    monkeypatch.setattr(log_routes, "docker", fake_docker)
+    monkeypatch.setattr(log_routes, "_DOCKER_CLIENT", None)
+
+    log_routes._get_docker_client()
+
+    assert calls == [{"timeout": log_routes._FALLBACK_DOCKER_TIMEOUT}]
+    assert log_routes._FALLBACK_DOCKER_TIMEOUT < 60
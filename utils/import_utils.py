@@ -91,6 +91,10 @@ def import_ujson() -> Tuple[Any, bool]:
     """Imports ujson with json as fallback"""
     return safe_import('ujson', fallback_value=__import__('json'))
 
+def import_orjson() -> Tuple[Any, bool]:
+    """Imports orjson for fast JSON serialization to bytes"""
+    return safe_import('orjson')
+
 def import_uvloop() -> Tuple[Any, bool]:
     """Imports uvloop for better async performance"""
     uvloop, success = safe_import('uvloop')
@@ -132,6 +136,14 @@ def get_performance_imports() -> dict:
         'description': 'Faster JSON processing'
     }
 
+    # orjson for fast JSON responses
+    orjson_module, orjson_available = import_orjson()
+    imports['orjson'] = {
+        'available': orjson_available,
+        'module': orjson_module,
+        'description': 'Faster JSON responses'
+    }
+
     # uvloop for better async performance
     uvloop_module, uvloop_available = import_uvloop()
     imports['uvloop'] = {